@@ -19,6 +19,9 @@ batch_evolve.py - 批量对齐所有 Skills 的经验
 
     # 备份原文件
     python scripts/batch_evolve.py --backup
+
+    # 指定并发数
+    python scripts/batch_evolve.py --workers 8
 """
 
 import os
@@ -28,68 +31,87 @@ import json
 import argparse
 import datetime
 import shutil
+import concurrent.futures
 from pathlib import Path
-from typing import List, Dict, Tuple
+from typing import Iterator, Dict, Tuple, Optional
 
 # 默认 Skills 目录
 DEFAULT_SKILLS_DIR = Path(__file__).parent.parent / "skills"
 
+# 默认并发数（I/O 密集型任务）
+DEFAULT_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
 # 章节标题
 SECTION_TITLE = "## User-Learned Best Practices & Constraints"
 SECTION_PATTERN = r'(\n+## User-Learned Best Practices & Constraints.*?)(?=\n## |\Z)'
+_SECTION_RE = re.compile(SECTION_PATTERN, re.DOTALL)
 
 
-def find_skills_with_evolution(skills_dir: Path) -> List[Path]:
-    """查找包含 evolution.json 的 Skills"""
-    result = []
+def find_skills_with_evolution(skills_dir: Path) -> Iterator[Path]:
+    """查找包含 evolution.json 的 Skills（逐个产出）"""
     if not skills_dir.exists():
-        return result
+        return
+
+    with os.scandir(skills_dir) as it:
+        entries = sorted(it, key=lambda e: e.name)
 
-    for item in sorted(skills_dir.iterdir()):
-        if not item.is_dir() or item.name.startswith('.'):
+    for entry in entries:
+        if entry.name.startswith('.') or not entry.is_dir():
             continue
-        if (item / "evolution.json").exists() and (item / "SKILL.md").exists():
-            result.append(item)
+        if (os.path.isfile(os.path.join(entry.path, "evolution.json"))
+                and os.path.isfile(os.path.join(entry.path, "SKILL.md"))):
+            yield Path(entry.path)
 
-    return result
+
+def _fmt_bullets(title: str, items) -> str:
+    """格式化列表类小节，无内容时返回空串"""
+    if not items:
+        return ""
+    bullets = "\n".join(f"- {item}" for item in items)
+    return f"\n{title}\n\n{bullets}\n"
 
 
 def generate_section(data: dict) -> str:
     """生成经验章节 Markdown"""
-    lines = ["", "", SECTION_TITLE, "",
-             "> **Auto-Generated Section**: 此章节由 skill-evolution 自动维护。", ""]
-
-    if data.get("preferences"):
-        lines.extend(["### User Preferences", ""])
-        lines.extend(f"- {item}" for item in data["preferences"])
-        lines.append("")
+    prefs = _fmt_bullets("### User Preferences", data.get("preferences"))
+    fixes = _fmt_bullets("### Known Fixes & Workarounds", data.get("fixes"))
+    ctxs = _fmt_bullets("### Context-Specific Notes", data.get("contexts"))
 
-    if data.get("fixes"):
-        lines.extend(["### Known Fixes & Workarounds", ""])
-        lines.extend(f"- {item}" for item in data["fixes"])
-        lines.append("")
+    custom_prompts = data.get("custom_prompts")
+    prompts = f"\n### Custom Instruction Injection\n\n{custom_prompts}\n" if custom_prompts else ""
 
-    if data.get("contexts"):
-        lines.extend(["### Context-Specific Notes", ""])
-        lines.extend(f"- {item}" for item in data["contexts"])
-        lines.append("")
+    last_updated = data.get("last_updated")
+    footer = f"\n*Last updated: {last_updated}*" if last_updated else ""
 
-    if data.get("custom_prompts"):
-        lines.extend(["### Custom Instruction Injection", "", data["custom_prompts"], ""])
+    return (
+        f"\n\n{SECTION_TITLE}\n\n"
+        f"> **Auto-Generated Section**: 此章节由 skill-evolution 自动维护。\n"
+        f"{prefs}{fixes}{ctxs}{prompts}{footer}"
+    )
 
-    if data.get("last_updated"):
-        lines.append(f"*Last updated: {data['last_updated']}*")
 
-    return "\n".join(lines)
+def preload_skill(skill_dir: Path) -> Tuple[Path, Optional[str], Optional[str]]:
+    """预读 evolution.json 与 SKILL.md，读取失败的文件返回 None（由 stitch_skill 重新读取并报告）"""
+    texts = []
+    for name in ("evolution.json", "SKILL.md"):
+        try:
+            texts.append((skill_dir / name).read_text(encoding='utf-8'))
+        except Exception:
+            texts.append(None)
+    return skill_dir, texts[0], texts[1]
 
 
-def stitch_skill(skill_dir: Path, dry_run: bool = False, backup: bool = False) -> Tuple[bool, str]:
-    """缝合单个 Skill"""
+def stitch_skill(skill_dir: Path, dry_run: bool = False, backup: bool = False,
+                 ts: Optional[str] = None, evolution_text: Optional[str] = None,
+                 content: Optional[str] = None) -> Tuple[bool, str]:
+    """缝合单个 Skill（ts 为备份文件时间戳；evolution_text/content 为预读内容，未提供时从磁盘读取）"""
     skill_md = skill_dir / "SKILL.md"
     evolution_json = skill_dir / "evolution.json"
 
     try:
-        data = json.loads(evolution_json.read_text(encoding='utf-8'))
+        if evolution_text is None:
+            evolution_text = evolution_json.read_text(encoding='utf-8')
+        data = json.loads(evolution_text)
     except Exception as e:
         return False, f"无法读取 evolution.json: {e}"
 
@@ -97,9 +119,18 @@ def stitch_skill(skill_dir: Path, dry_run: bool = False, backup: bool = False) -
         return True, "无内容，跳过"
 
     section = generate_section(data)
-    content = skill_md.read_text(encoding='utf-8')
+    if content is None:
+        content = skill_md.read_text(encoding='utf-8')
+
+    # 先用 str.find 判断章节是否存在，不存在时无需正则
+    match = None
+    idx = content.find(SECTION_TITLE)
+    if idx != -1:
+        start = idx
+        while start > 0 and content[start - 1] == '\n':
+            start -= 1
+        match = _SECTION_RE.search(content, start)
 
-    match = re.search(SECTION_PATTERN, content, re.DOTALL)
     if match:
         new_content = content[:match.start()] + section
         action = "更新"
@@ -107,37 +138,73 @@ def stitch_skill(skill_dir: Path, dry_run: bool = False, backup: bool = False) -
         new_content = content.rstrip() + section
         action = "追加"
 
+    # 内容未变化时不写文件（也不备份），避免无谓的 mtime 变化
+    if new_content == content:
+        return True, "无变化"
+
     if dry_run:
         return True, f"[Dry Run] 将{action}章节"
 
     if backup:
-        ts = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
-        shutil.copy2(skill_md, skill_md.with_suffix(f'.md.bak.{ts}'))
-
-    skill_md.write_text(new_content, encoding='utf-8')
+        ts = ts or datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
+        backup_path = skill_md.with_suffix(f'.md.bak.{ts}')
+        try:
+            # 硬链接备份，无需复制数据
+            os.link(skill_md, backup_path)
+        except OSError:
+            shutil.copy2(skill_md, backup_path)
+
+        # 写入新文件再替换，备份仍指向原内容
+        tmp_path = skill_md.with_suffix('.md.tmp')
+        tmp_path.write_text(new_content, encoding='utf-8')
+        shutil.copymode(backup_path, tmp_path)
+        os.replace(tmp_path, skill_md)
+    else:
+        skill_md.write_text(new_content, encoding='utf-8')
     return True, f"已{action}章节"
 
 
-def batch_evolve(skills_dir: Path, dry_run: bool = False, backup: bool = False) -> Dict:
-    """批量对齐"""
-    skills = find_skills_with_evolution(skills_dir)
-
-    if not skills:
-        print("没有找到包含 evolution.json 的 Skills")
-        return {"total": 0, "success": 0, "failed": 0}
-
-    print(f"找到 {len(skills)} 个需要对齐的 Skills")
-    if dry_run:
-        print("[Dry Run 模式]")
-    print("-" * 40)
-
-    stats = {"total": len(skills), "success": 0, "failed": 0}
+def batch_evolve(skills_dir: Path, dry_run: bool = False, backup: bool = False,
+                 max_workers: int = DEFAULT_WORKERS) -> Dict:
+    """批量对齐（并发处理各 Skill）"""
+    # 整批共用一个备份时间戳
+    ts = datetime.datetime.now().strftime('%Y%m%d_%H%M%S') if backup else None
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # 阶段一：边扫描边并发预读文件
+        load_futures = [
+            executor.submit(preload_skill, skill_dir)
+            for skill_dir in find_skills_with_evolution(skills_dir)
+        ]
+
+        if not load_futures:
+            print("没有找到包含 evolution.json 的 Skills")
+            return {"total": 0, "success": 0, "failed": 0}
+
+        print(f"找到 {len(load_futures)} 个需要对齐的 Skills")
+        if dry_run:
+            print("[Dry Run 模式]")
+        print("-" * 40)
+
+        # 阶段二：预读完成的 Skill 立即进入解析、缝合与写回
+        future_map = {}
+        for load_future in concurrent.futures.as_completed(load_futures):
+            skill_dir, evolution_text, content = load_future.result()
+            future = executor.submit(
+                stitch_skill, skill_dir, dry_run, backup, ts, evolution_text, content
+            )
+            future_map[future] = skill_dir.name
+
+        results = []
+        for future in concurrent.futures.as_completed(future_map):
+            success, msg = future.result()
+            results.append((future_map[future], success, msg))
+
+    stats = {"total": len(results), "success": 0, "failed": 0}
     failed = []
 
-    for skill_dir in skills:
-        name = skill_dir.name
-        success, msg = stitch_skill(skill_dir, dry_run=dry_run, backup=backup)
-
+    # 按名称排序，保持输出顺序稳定
+    for name, success, msg in sorted(results):
         if success:
             stats["success"] += 1
             print(f"✅ {name}: {msg}")
@@ -157,6 +224,17 @@ def batch_evolve(skills_dir: Path, dry_run: bool = False, backup: bool = False)
     return stats
 
 
+def positive_int(value: str) -> int:
+    """argparse 参数类型：不小于 1 的整数"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"无效的整数: {value}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"必须不小于 1: {value}")
+    return number
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='批量对齐所有 Skills 的经验',
@@ -170,10 +248,13 @@ def main():
     )
     parser.add_argument('--dry-run', action='store_true', help='预览模式')
     parser.add_argument('--backup', '-b', action='store_true', help='备份原文件')
+    parser.add_argument('--workers', '-w', type=positive_int, default=DEFAULT_WORKERS,
+                        help=f'并发数 (默认: {DEFAULT_WORKERS})')
 
     args = parser.parse_args()
 
-    stats = batch_evolve(args.skills_dir, dry_run=args.dry_run, backup=args.backup)
+    stats = batch_evolve(args.skills_dir, dry_run=args.dry_run, backup=args.backup,
+                         max_workers=args.workers)
     sys.exit(1 if stats["failed"] > 0 else 0)
 
 
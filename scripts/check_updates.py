@@ -19,26 +19,76 @@ check_updates.py - 批量检查 Skills 更新状态
 
     # 输出到文件（CI/CD 用）
     python scripts/check_updates.py --json --output report.json
+
+    # 忽略远程 hash 缓存，强制重新查询
+    python scripts/check_updates.py --no-cache
 """
 
+import io
 import os
 import sys
 import re
 import json
-import subprocess
-import concurrent.futures
+import time
+import atexit
+import asyncio
+import functools
 import argparse
+import tempfile
+import urllib.request
 from pathlib import Path
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Iterable, Iterator
+
+# 优先使用 orjson 输出 JSON（可选依赖）
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 # 默认 Skills 目录（相对于脚本位置）
 DEFAULT_SKILLS_DIR = Path(__file__).parent.parent / "skills"
 
+# 远程 hash 缓存文件（跨进程复用查询结果）
+CACHE_FILE = Path(
+    os.environ.get('XDG_CACHE_HOME') or Path.home() / ".cache"
+) / "claude-skills-plugin" / "remote_hashes.json"
+
+# 缓存有效期（秒）
+DEFAULT_CACHE_TTL = 300
+
+# 预编译正则
+_FRONTMATTER_RE = re.compile(r'^---\s*\n(.*?)\n---', re.DOTALL)
+
+# 字段别名 (标准字段, 旧字段)
+FIELD_ALIASES = (
+    ('source_url', 'github_url'),
+    ('source_hash', 'github_hash'),
+)
+
+# frontmatter 读取上限（防止无结束标记时读取整个文件）
+FRONTMATTER_MAX_BYTES = 64 * 1024
+
+
+def read_frontmatter_block(path: Path) -> str:
+    """流式读取 SKILL.md 开头的 frontmatter（到第二个 --- 为止），不读取正文"""
+    chunks = []
+    size = 0
+    with open(path, 'rb') as f:
+        for line in f:
+            chunks.append(line)
+            size += len(line)
+            if len(chunks) == 1:
+                if not line.startswith(b'---'):
+                    break
+            elif line.startswith(b'---') or size >= FRONTMATTER_MAX_BYTES:
+                break
+    return b''.join(chunks).decode('utf-8')
+
 
 def parse_frontmatter(content: str) -> dict:
     """简单解析 YAML frontmatter"""
-    pattern = r'^---\s*\n(.*?)\n---'
-    match = re.match(pattern, content, re.DOTALL)
+    match = _FRONTMATTER_RE.match(content)
     if not match:
         return {}
 
@@ -59,135 +109,316 @@ def parse_frontmatter(content: str) -> dict:
     return result
 
 
-def get_remote_hash(url: str, timeout: int = 15) -> Optional[str]:
-    """获取远程 HEAD hash"""
+def canonicalize_frontmatter(fm: dict) -> dict:
+    """将 github_* 旧字段归一到 source_* 字段（解析后调用一次）"""
+    for key, legacy_key in FIELD_ALIASES:
+        if not fm.get(key):
+            fm[key] = fm.get(legacy_key, '')
+    return fm
+
+
+def _pkt_lines(data: bytes):
+    """解析 Git pkt-line 数据流，flush/delim 包返回 None"""
+    pos = 0
+    while pos + 4 <= len(data):
+        length = int(data[pos:pos + 4], 16)
+        if length < 4:
+            pos += 4
+            yield None
+            continue
+        yield data[pos + 4:pos + length]
+        pos += length
+
+
+def _pkt(line: str) -> bytes:
+    """编码单个 pkt-line"""
+    payload = line.encode('utf-8')
+    return f"{len(payload) + 4:04x}".encode('ascii') + payload
+
+
+def get_remote_hash_http(url: str, timeout: int = 15) -> Optional[str]:
+    """通过 Git Smart HTTP（协议 v2）获取远程 HEAD hash，无需启动 git 子进程"""
+    base = url.rstrip('/')
+    headers = {'Git-Protocol': 'version=2', 'User-Agent': 'git/2.0 (check_updates.py)'}
+
+    req = urllib.request.Request(f"{base}/info/refs?service=git-upload-pack", headers=headers)
+    with urllib.request.urlopen(req, timeout=timeout) as resp:
+        advert = resp.read()
+
+    lines = [line.rstrip(b'\n') for line in _pkt_lines(advert) if line is not None]
+
+    if b'version 2' not in lines:
+        # 服务端仅支持 v1：HEAD 位于引用广告中
+        for line in lines:
+            ref = line.split(b'\0', 1)[0]
+            parts = ref.split(b' ')
+            if len(parts) == 2 and parts[1] == b'HEAD':
+                return parts[0].decode('ascii')
+        return None
+
+    # 协议 v2：发送 ls-refs 命令，只请求 HEAD
+    body = _pkt("command=ls-refs\n") + b"0001" + _pkt("ref-prefix HEAD\n") + b"0000"
+    req = urllib.request.Request(
+        f"{base}/git-upload-pack",
+        data=body,
+        headers={**headers, 'Content-Type': 'application/x-git-upload-pack-request'},
+    )
+    with urllib.request.urlopen(req, timeout=timeout) as resp:
+        refs = resp.read()
+
+    for line in _pkt_lines(refs):
+        if line is None:
+            continue
+        parts = line.rstrip(b'\n').split(b' ')
+        if len(parts) >= 2 and parts[1] == b'HEAD':
+            return parts[0].decode('ascii')
+    return None
+
+
+async def get_remote_hash_async(url: str, timeout: int = 15) -> Optional[str]:
+    """获取远程 HEAD hash（协程版本：HTTP 查询在线程池中执行，git 使用异步子进程）"""
+    loop = asyncio.get_running_loop()
+
+    if url.startswith(('http://', 'https://')):
+        try:
+            remote = await loop.run_in_executor(
+                None, functools.partial(get_remote_hash_http, url, timeout)
+            )
+            if remote:
+                return remote
+        except Exception:
+            pass  # 回退到 git ls-remote（如需凭据助手等）
+
     try:
-        result = subprocess.run(
-            ['git', 'ls-remote', url, 'HEAD'],
-            capture_output=True,
-            text=True,
-            timeout=timeout
+        proc = await asyncio.create_subprocess_exec(
+            'git', 'ls-remote', url, 'HEAD',
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
         )
-        if result.returncode == 0 and result.stdout:
-            return result.stdout.split()[0]
     except Exception:
-        pass
-    return None
+        return None
 
+    try:
+        stdout, _ = await asyncio.wait_for(proc.communicate(), timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        return None
+
+    if proc.returncode == 0 and stdout:
+        return stdout.split()[0].decode('ascii')
+    return None
 
-def scan_skills(skills_dir: Path) -> List[Dict]:
-    """扫描 Skills 目录"""
-    skills = []
 
+def get_remote_hash(url: str, timeout: int = 15) -> Optional[str]:
+    """获取远程 HEAD hash"""
+    return asyncio.run(get_remote_hash_async(url, timeout))
+
+
+class RemoteHashCache:
+    """远程 hash 磁盘缓存：首次使用时加载，进程退出时原子写回"""
+
+    def __init__(self, path: Path = CACHE_FILE, ttl: int = DEFAULT_CACHE_TTL):
+        self.path = path
+        self.ttl = ttl
+        self._entries = None
+        self._dirty = False
+
+    def _load(self) -> dict:
+        if self._entries is None:
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self._entries = json.load(f)
+            except (OSError, ValueError):
+                self._entries = {}
+            atexit.register(self.save)
+        return self._entries
+
+    def get(self, url: str) -> Optional[str]:
+        """返回未过期的缓存 hash"""
+        entry = self._load().get(url)
+        if entry and time.time() - entry.get('ts', 0) < self.ttl:
+            return entry.get('hash')
+        return None
+
+    def put(self, url: str, remote_hash: str):
+        """记录查询结果"""
+        self._load()[url] = {'hash': remote_hash, 'ts': time.time()}
+        self._dirty = True
+
+    def save(self):
+        """原子写回缓存文件"""
+        if not self._dirty:
+            return
+        tmp_path = None
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # 每个进程使用独立的临时文件，并发运行时互不覆盖
+            fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(self._entries, f)
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+        except OSError:
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+
+
+def scan_skills(skills_dir: Path) -> Iterator[Dict]:
+    """扫描 Skills 目录（逐个产出）"""
     if not skills_dir.exists():
-        return skills
+        return
+
+    with os.scandir(skills_dir) as it:
+        entries = sorted(it, key=lambda e: e.name)
 
-    for item in sorted(skills_dir.iterdir()):
-        if not item.is_dir() or item.name.startswith('.'):
+    for entry in entries:
+        if entry.name.startswith('.') or not entry.is_dir():
             continue
 
-        skill_md = item / "SKILL.md"
-        if not skill_md.exists():
+        skill_md = os.path.join(entry.path, "SKILL.md")
+        if not os.path.isfile(skill_md):
             continue
+        item = Path(entry.path)
 
         try:
-            content = skill_md.read_text(encoding='utf-8')
-            fm = parse_frontmatter(content)
+            fm = canonicalize_frontmatter(parse_frontmatter(read_frontmatter_block(skill_md)))
 
-            source_url = fm.get('source_url') or fm.get('github_url', '')
-            local_hash = fm.get('source_hash') or fm.get('github_hash', '')
-
-            skills.append({
+            skill = {
                 "name": fm.get('name', item.name),
                 "dir": str(item),
                 "version": fm.get('version', ''),
-                "source_url": source_url,
-                "local_hash": local_hash,
-            })
+                "source_url": fm['source_url'],
+                "local_hash": fm['source_hash'],
+            }
         except Exception:
-            pass
+            continue
 
-    return skills
+        yield skill
 
 
-def check_updates(skills: List[Dict], max_workers: int = 5) -> List[Dict]:
-    """并发检查更新"""
+async def _check_updates_async(skills: Iterable[Dict], max_workers: int,
+                               cache: Optional[RemoteHashCache]) -> List[Dict]:
+    """在事件循环中并发查询远程 hash，并发数由信号量限制"""
     results = []
-    managed = [s for s in skills if s.get('source_url')]
-    unmanaged = [s for s in skills if not s.get('source_url')]
-
-    for s in unmanaged:
-        s['status'] = 'unmanaged'
-        s['remote_hash'] = ''
-        results.append(s)
-
-    if managed:
-        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_map = {
-                executor.submit(get_remote_hash, s['source_url']): s
-                for s in managed
-            }
-            for future in concurrent.futures.as_completed(future_map):
-                skill = future_map[future]
-                remote = future.result()
-                skill['remote_hash'] = remote or ''
-
-                if not remote:
-                    skill['status'] = 'error'
-                elif not skill['local_hash']:
-                    skill['status'] = 'unknown'
-                elif remote != skill['local_hash']:
-                    skill['status'] = 'outdated'
-                else:
-                    skill['status'] = 'current'
-
-                results.append(skill)
+    managed = []
+    semaphore = asyncio.Semaphore(max_workers)
+
+    async def fetch(url: str) -> Optional[str]:
+        if cache is not None:
+            cached = cache.get(url)
+            if cached:
+                return cached
+        async with semaphore:
+            remote = await get_remote_hash_async(url)
+        if remote and cache is not None:
+            cache.put(url, remote)
+        return remote
+
+    # 同一 source_url 只查询一次（多个 Skill 可能来自同一仓库）
+    url_tasks = {}
+    for skill in skills:
+        url = skill.get('source_url')
+        if not url:
+            skill['status'] = 'unmanaged'
+            skill['remote_hash'] = ''
+            results.append(skill)
+            continue
+        if url not in url_tasks:
+            url_tasks[url] = asyncio.ensure_future(fetch(url))
+            # 让出控制权，使查询在继续扫描的同时启动
+            await asyncio.sleep(0)
+        managed.append(skill)
+
+    for skill in managed:
+        remote = await url_tasks[skill['source_url']]
+        skill['remote_hash'] = remote or ''
+
+        if not remote:
+            skill['status'] = 'error'
+        elif not skill['local_hash']:
+            skill['status'] = 'unknown'
+        elif remote != skill['local_hash']:
+            skill['status'] = 'outdated'
+        else:
+            skill['status'] = 'current'
+
+        results.append(skill)
 
     return results
 
 
+def check_updates(skills: Iterable[Dict], max_workers: int = 5,
+                  cache: Optional[RemoteHashCache] = None) -> List[Dict]:
+    """并发检查更新（边扫描边提交查询，cache 为 None 时不使用缓存）"""
+    return asyncio.run(_check_updates_async(skills, max_workers, cache))
+
+
 def format_table(results: List[Dict]) -> str:
     """格式化表格"""
-    lines = [
-        f"{'Name':<25} | {'Status':<10} | {'Version':<10} | {'Source URL':<40}",
-        "-" * 90
-    ]
+    buf = io.StringIO()
+    w = buf.write
+    w(f"{'Name':<25} | {'Status':<10} | {'Version':<10} | {'Source URL':<40}\n")
+    w("-" * 90)
     for r in sorted(results, key=lambda x: (x['status'] != 'outdated', x['name'])):
         name = r['name'][:24]
         status = r['status'][:9]
         version = (r.get('version') or 'N/A')[:9]
         url = (r.get('source_url') or 'N/A')[:39]
-        lines.append(f"{name:<25} | {status:<10} | {version:<10} | {url:<40}")
-    return '\n'.join(lines)
+        w(f"\n{name:<25} | {status:<10} | {version:<10} | {url:<40}")
+    return buf.getvalue()
 
 
 def format_summary(results: List[Dict]) -> str:
     """格式化摘要"""
-    total = len(results)
-    outdated = [r for r in results if r['status'] == 'outdated']
-    current = [r for r in results if r['status'] == 'current']
-    unmanaged = [r for r in results if r['status'] == 'unmanaged']
-    errors = [r for r in results if r['status'] == 'error']
-
-    lines = [
-        "Skills Update Check Report",
-        "=" * 40,
-        f"Total: {total}",
-        f"  Current: {len(current)}",
-        f"  Outdated: {len(outdated)}",
-        f"  Unmanaged: {len(unmanaged)}",
-        f"  Errors: {len(errors)}",
-    ]
+    counts = {'current': 0, 'outdated': 0, 'unmanaged': 0, 'error': 0}
+    outdated = []
+    for r in results:
+        status = r['status']
+        if status in counts:
+            counts[status] += 1
+        if status == 'outdated':
+            outdated.append(r)
+
+    buf = io.StringIO()
+    w = buf.write
+    w("Skills Update Check Report\n")
+    w("=" * 40 + "\n")
+    w(f"Total: {len(results)}\n")
+    w(f"  Current: {counts['current']}\n")
+    w(f"  Outdated: {counts['outdated']}\n")
+    w(f"  Unmanaged: {counts['unmanaged']}\n")
+    w(f"  Errors: {counts['error']}")
 
     if outdated:
-        lines.append("")
-        lines.append("Outdated Skills:")
+        w("\n\nOutdated Skills:")
         for r in outdated:
-            lines.append(f"  - {r['name']}")
-            lines.append(f"    Local:  {r['local_hash'][:12]}...")
-            lines.append(f"    Remote: {r['remote_hash'][:12]}...")
+            w(f"\n  - {r['name']}")
+            w(f"\n    Local:  {r['local_hash'][:12]}...")
+            w(f"\n    Remote: {r['remote_hash'][:12]}...")
+
+    return buf.getvalue()
 
-    return '\n'.join(lines)
+
+def dump_json(obj) -> bytes:
+    """序列化为缩进 JSON（UTF-8 字节），有 orjson 时使用 orjson"""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def positive_int(value: str) -> int:
+    """argparse 参数类型：不小于 1 的整数"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"无效的整数: {value}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"必须不小于 1: {value}")
+    return number
 
 
 def main():
@@ -200,6 +431,7 @@ def main():
   python check_updates.py --skills-dir ./skills  # 指定目录
   python check_updates.py --json --output r.json # 输出到文件
   python check_updates.py --outdated-only        # 只显示需更新的
+  python check_updates.py --no-cache             # 忽略缓存，强制重新查询
         """
     )
     parser.add_argument(
@@ -212,37 +444,39 @@ def main():
     parser.add_argument('--summary', '-s', action='store_true', help='输出摘要格式')
     parser.add_argument('--outdated-only', action='store_true', help='只显示需要更新的')
     parser.add_argument('--output', '-o', type=Path, help='输出到文件')
-    parser.add_argument('--workers', '-w', type=int, default=5, help='并发数 (默认: 5)')
+    parser.add_argument('--workers', '-w', type=positive_int, default=5, help='并发数 (默认: 5)')
+    parser.add_argument('--cache-ttl', type=int, default=DEFAULT_CACHE_TTL,
+                        help=f'远程 hash 缓存有效期，秒 (默认: {DEFAULT_CACHE_TTL})')
+    parser.add_argument('--no-cache', action='store_true', help='不使用远程 hash 缓存')
 
     args = parser.parse_args()
 
-    # 扫描
-    skills = scan_skills(args.skills_dir)
-    if not skills:
+    # 扫描并检查
+    cache = None if args.no_cache else RemoteHashCache(ttl=args.cache_ttl)
+    results = check_updates(scan_skills(args.skills_dir), max_workers=args.workers, cache=cache)
+    if not results:
         print(f"未找到 Skills: {args.skills_dir}", file=sys.stderr)
         sys.exit(1)
 
-    # 检查
-    results = check_updates(skills, max_workers=args.workers)
-
     # 过滤
     if args.outdated_only:
         results = [r for r in results if r['status'] == 'outdated']
 
     # 格式化输出
     if args.json:
-        output = json.dumps(results, indent=2, ensure_ascii=False)
+        output = dump_json(results)
     elif args.summary:
-        output = format_summary(results)
+        output = format_summary(results).encode('utf-8')
     else:
-        output = format_table(results)
+        output = format_table(results).encode('utf-8')
 
     # 输出
     if args.output:
-        args.output.write_text(output, encoding='utf-8')
+        args.output.write_bytes(output)
         print(f"已保存到: {args.output}")
     else:
-        print(output)
+        sys.stdout.flush()
+        sys.stdout.buffer.write(output + b"\n")
 
     # 退出码：有 outdated 则返回 1（便于 CI/CD 判断）
     outdated_count = sum(1 for r in results if r['status'] == 'outdated')
@@ -19,169 +19,182 @@ validate_all.py - 批量验证 Skills 元数据
 
     # 严格模式（检查扩展字段）
     python scripts/validate_all.py --strict
+
+    # 指定并行进程数
+    python scripts/validate_all.py --workers 4
 """
 
+import io
 import os
 import sys
 import re
 import json
 import argparse
+import functools
+import concurrent.futures
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Optional, Iterable, Iterator, TextIO
+
+# 优先使用 orjson 输出 JSON（可选依赖）
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 # 默认 Skills 目录
 DEFAULT_SKILLS_DIR = Path(__file__).parent.parent / "skills"
 
+# 预编译正则
+_NAME_RE = re.compile(r'^[a-z0-9][a-z0-9-]*[a-z0-9]$|^[a-z0-9]$')
+_URL_RE = re.compile(r'^https?://')
+_HASH_RE = re.compile(r'^[a-f0-9]{40}$')
+_VERSION_RE = re.compile(r'^\d+\.\d+\.\d+$|^\d{4}\.\d{2}\.\d{2}$')
+
+# YAML 布尔值
+_BOOLS = {'true': True, 'false': False}
+
+# 字段别名 (标准字段, 旧字段)
+FIELD_ALIASES = (
+    ('source_url', 'github_url'),
+    ('source_hash', 'github_hash'),
+)
+
+# frontmatter 读取上限（防止无结束标记时读取整个文件）
+FRONTMATTER_MAX_CHARS = 64 * 1024
+
+# body 最少字符数
+MIN_BODY_LENGTH = 50
+
+# Skills 数量低于此值时串行验证（避免进程池启动开销）
+PARALLEL_THRESHOLD = 32
+
+
+def iter_header_lines(f: TextIO) -> Iterator[str]:
+    """逐行读取文件开头部分（最多 FRONTMATTER_MAX_CHARS 字符），由调用方决定何时停止"""
+    size = 0
+    for line in f:
+        size += len(line)
+        if size > FRONTMATTER_MAX_CHARS:
+            return
+        yield line
+
+
+def body_has_content(f: TextIO, min_length: int = MIN_BODY_LENGTH) -> bool:
+    """从当前位置读取正文，检查去除首尾空白后是否达到 min_length，读够即停止"""
+    # 首个非空白字符到已读到的最后一个非空白字符的长度
+    length = 0
+    # 其后尚未计入的空白字符数（后面出现非空白字符时才计入）
+    pending = 0
+    for chunk in iter(functools.partial(f.read, 4096), ''):
+        if not length:
+            chunk = chunk.lstrip()
+        stripped = chunk.rstrip()
+        if stripped:
+            length += pending + len(stripped)
+            pending = len(chunk) - len(stripped)
+            if length >= min_length:
+                return True
+        else:
+            pending += len(chunk)
+    return length >= min_length
+
+
+def parse_frontmatter(lines: Iterable[str]) -> Optional[dict]:
+    """单遍扫描解析 YAML frontmatter，读到结束标记 --- 即停止；格式无效返回 None"""
+    it = iter(lines)
+    first = next(it, '')
+    if first.rstrip() != '---' or not first.endswith('\n'):
+        return None
 
-def parse_frontmatter(content: str) -> Tuple[Optional[dict], str]:
-    """解析 YAML frontmatter，返回 (frontmatter, body)"""
-    pattern = r'^---\s*\n(.*?)\n---\s*\n(.*)$'
-    match = re.match(pattern, content, re.DOTALL)
-
-    if not match:
-        return None, content
-
-    yaml_content = match.group(1)
-    body = match.group(2)
     result = {}
-
     current_key = None
     current_list = None
+    bools = _BOOLS
+
+    for index, line in enumerate(it):
+        # 结束标记（紧跟开始标记的 --- 不算，与原正则行为一致）
+        if index and line.endswith('\n') and line.rstrip() == '---':
+            return result
 
-    for line in yaml_content.split('\n'):
         stripped = line.strip()
 
-        if not stripped or stripped.startswith('#'):
+        if not stripped or stripped[0] == '#':
             continue
 
         # 检查是否是列表项
-        if stripped.startswith('- ') and current_key:
+        if current_key and stripped.startswith('- '):
             if current_list is None:
                 current_list = []
             current_list.append(stripped[2:].strip())
             result[current_key] = current_list
             continue
 
-        if ':' in stripped:
-            # 保存之前的列表
-            current_list = None
-
-            key, _, value = stripped.partition(':')
-            key = key.strip()
-            value = value.strip()
-
-            current_key = key
-
-            if value:
-                # 移除引号
-                if (value.startswith('"') and value.endswith('"')) or \
-                   (value.startswith("'") and value.endswith("'")):
-                    value = value[1:-1]
-
-                # 布尔值
-                if value.lower() == 'true':
-                    value = True
-                elif value.lower() == 'false':
-                    value = False
-
-                result[key] = value
-            else:
-                # 可能是列表的开始
-                current_list = []
-
-    return result, body
-
-
-def validate_name(name: str) -> List[str]:
-    """验证 name 字段"""
-    errors = []
-
-    if not name:
-        errors.append("name 字段缺失")
-        return errors
-
-    if not isinstance(name, str):
-        errors.append("name 必须是字符串")
-        return errors
-
-    if len(name) > 64:
-        errors.append(f"name 超过 64 字符 (当前: {len(name)})")
-
-    if not re.match(r'^[a-z0-9][a-z0-9-]*[a-z0-9]$|^[a-z0-9]$', name):
-        errors.append("name 格式无效 (应为小写字母、数字、连字符)")
-
-    return errors
-
-
-def validate_description(description: str) -> List[str]:
-    """验证 description 字段"""
-    errors = []
-
-    if not description:
-        errors.append("description 字段缺失")
-        return errors
-
-    if not isinstance(description, str):
-        errors.append("description 必须是字符串")
-        return errors
-
-    if len(description) < 10:
-        errors.append(f"description 过短 (最少 10 字符，当前: {len(description)})")
+        key, sep, value = stripped.partition(':')
+        if not sep:
+            continue
 
-    if len(description) > 1024:
-        errors.append(f"description 超过 1024 字符 (当前: {len(description)})")
+        # 保存之前的列表
+        current_list = None
+        current_key = key = key.strip()
+        value = value.strip()
 
-    return errors
+        if value:
+            # 移除引号
+            if value[0] in "\"'" and value[-1] == value[0]:
+                value = value[1:-1]
 
+            # 布尔值
+            result[key] = bools.get(value.lower(), value)
+        else:
+            # 可能是列表的开始
+            current_list = []
 
-def validate_source_url(url: str) -> List[str]:
-    """验证 source_url 字段"""
-    errors = []
+    # 没有找到结束标记
+    return None
 
-    if not url:
-        return errors  # 可选字段
 
-    if not isinstance(url, str):
-        errors.append("source_url 必须是字符串")
-        return errors
+def canonicalize_frontmatter(fm: dict) -> dict:
+    """将 github_* 旧字段归一到 source_* 字段（解析后调用一次）"""
+    for key, legacy_key in FIELD_ALIASES:
+        if not fm.get(key):
+            fm[key] = fm.get(legacy_key, '')
+    return fm
 
-    if not re.match(r'^https?://', url):
-        errors.append("source_url 必须是有效的 URL")
 
-    return errors
+# 字段验证表: (字段, 必需, 最小长度, 最大长度, 格式正则, 格式错误信息)
+_FIELD_VALIDATORS = (
+    ('name', True, None, 64, _NAME_RE, "name 格式无效 (应为小写字母、数字、连字符)"),
+    ('description', True, 10, 1024, None, None),
+    ('source_url', False, None, None, _URL_RE, "source_url 必须是有效的 URL"),
+    ('source_hash', False, None, None, _HASH_RE, "source_hash 应为 40 字符的十六进制字符串"),
+    ('version', False, None, None, _VERSION_RE, "version 格式无效 (应为 X.Y.Z 或 YYYY.MM.DD)"),
+)
 
 
-def validate_source_hash(hash_val: str) -> List[str]:
-    """验证 source_hash 字段"""
+def validate_fields(frontmatter: dict) -> List[str]:
+    """按 _FIELD_VALIDATORS 验证所有字段，错误信息只在失败时构造"""
     errors = []
 
-    if not hash_val:
-        return errors  # 可选字段
-
-    if not isinstance(hash_val, str):
-        errors.append("source_hash 必须是字符串")
-        return errors
-
-    if not re.match(r'^[a-f0-9]{40}$', hash_val):
-        errors.append("source_hash 应为 40 字符的十六进制字符串")
-
-    return errors
-
-
-def validate_version(version: str) -> List[str]:
-    """验证 version 字段"""
-    errors = []
+    for key, required, min_len, max_len, pattern, format_error in _FIELD_VALIDATORS:
+        value = frontmatter.get(key, '')
 
-    if not version:
-        return errors  # 可选字段
+        if not value:
+            if required:
+                errors.append(f"{key} 字段缺失")
+            continue
 
-    if not isinstance(version, str):
-        errors.append("version 必须是字符串")
-        return errors
+        if not isinstance(value, str):
+            errors.append(f"{key} 必须是字符串")
+            continue
 
-    # 支持语义化版本或日期版本
-    if not re.match(r'^\d+\.\d+\.\d+$|^\d{4}\.\d{2}\.\d{2}$', version):
-        errors.append("version 格式无效 (应为 X.Y.Z 或 YYYY.MM.DD)")
+        length = len(value)
+        if min_len is not None and length < min_len:
+            errors.append(f"{key} 过短 (最少 {min_len} 字符，当前: {length})")
+        if max_len is not None and length > max_len:
+            errors.append(f"{key} 超过 {max_len} 字符 (当前: {length})")
+        if pattern is not None and not pattern.match(value):
+            errors.append(format_error)
 
     return errors
 
@@ -198,51 +211,47 @@ def validate_skill(skill_dir: Path, strict: bool = False) -> Dict:
 
     skill_md = skill_dir / "SKILL.md"
 
-    # 检查 SKILL.md 存在
-    if not skill_md.exists():
+    # 读取内容（只读取 frontmatter 与足够判断长度的正文）
+    # 结构性错误（文件缺失/不可读/frontmatter 无效）直接返回，不再做字段验证
+    try:
+        # 文本模式读取：增量解码，换行统一为 \n（\r\n 不会重复计入正文长度）
+        with open(skill_md, 'r', encoding='utf-8') as f:
+            # 解析 frontmatter
+            frontmatter = parse_frontmatter(iter_header_lines(f))
+            has_body = frontmatter is not None and body_has_content(f)
+    except FileNotFoundError:
         result["valid"] = False
         result["errors"].append("SKILL.md 文件不存在")
         return result
-
-    # 读取内容
-    try:
-        content = skill_md.read_text(encoding='utf-8')
     except Exception as e:
         result["valid"] = False
         result["errors"].append(f"无法读取文件: {e}")
         return result
 
-    # 解析 frontmatter
-    frontmatter, body = parse_frontmatter(content)
-
     if frontmatter is None:
         result["valid"] = False
         result["errors"].append("无效的 YAML frontmatter 格式")
         return result
 
-    # 验证必需字段
-    result["errors"].extend(validate_name(frontmatter.get('name', '')))
-    result["errors"].extend(validate_description(frontmatter.get('description', '')))
+    canonicalize_frontmatter(frontmatter)
 
-    # 验证可选字段
-    source_url = frontmatter.get('source_url') or frontmatter.get('github_url', '')
-    source_hash = frontmatter.get('source_hash') or frontmatter.get('github_hash', '')
+    # 验证字段
+    result["errors"].extend(validate_fields(frontmatter))
 
-    result["errors"].extend(validate_source_url(source_url))
-    result["errors"].extend(validate_source_hash(source_hash))
-    result["errors"].extend(validate_version(frontmatter.get('version', '')))
+    source_url = frontmatter['source_url']
+    version = frontmatter.get('version', '')
 
     # 严格模式检查
     if strict:
         if not source_url:
             result["warnings"].append("缺少 source_url (无法进行版本管理)")
-        if not frontmatter.get('version'):
+        if not version:
             result["warnings"].append("缺少 version 字段")
         if not frontmatter.get('created_at'):
             result["warnings"].append("缺少 created_at 字段")
 
     # 检查 body 内容
-    if len(body.strip()) < 50:
+    if not has_body:
         result["warnings"].append("SKILL.md body 内容过少")
 
     # 设置最终状态
@@ -252,85 +261,112 @@ def validate_skill(skill_dir: Path, strict: bool = False) -> Dict:
     return result
 
 
-def validate_all(skills_dir: Path, strict: bool = False) -> List[Dict]:
-    """验证所有 Skills"""
-    results = []
-
+def validate_all(skills_dir: Path, strict: bool = False,
+                 max_workers: Optional[int] = None) -> List[Dict]:
+    """验证所有 Skills（数量较多时使用多进程并行）"""
     if not skills_dir.exists():
-        return results
+        return []
 
-    for item in sorted(skills_dir.iterdir()):
-        if not item.is_dir() or item.name.startswith('.'):
-            continue
+    with os.scandir(skills_dir) as it:
+        entries = sorted(it, key=lambda e: e.name)
+
+    dirs = [
+        Path(entry.path) for entry in entries
+        if not entry.name.startswith('.') and entry.is_dir()
+    ]
 
-        result = validate_skill(item, strict=strict)
-        results.append(result)
+    if len(dirs) < PARALLEL_THRESHOLD or max_workers == 1:
+        return [validate_skill(d, strict=strict) for d in dirs]
 
-    return results
+    with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(
+            functools.partial(validate_skill, strict=strict), dirs, chunksize=16
+        ))
 
 
 def format_table(results: List[Dict]) -> str:
     """格式化表格输出"""
-    lines = [
-        f"{'Name':<25} | {'Status':<8} | {'Errors':<5} | {'Warnings':<8}",
-        "-" * 55
-    ]
+    buf = io.StringIO()
+    w = buf.write
+    w(f"{'Name':<25} | {'Status':<8} | {'Errors':<5} | {'Warnings':<8}\n")
+    w("-" * 55 + "\n")
 
+    valid = 0
     for r in sorted(results, key=lambda x: (x['valid'], x['name'])):
         name = r['name'][:24]
-        status = "✅ OK" if r['valid'] else "❌ FAIL"
+        if r['valid']:
+            valid += 1
+            status = "✅ OK"
+        else:
+            status = "❌ FAIL"
         errors = len(r['errors'])
         warnings = len(r['warnings'])
-        lines.append(f"{name:<25} | {status:<8} | {errors:<5} | {warnings:<8}")
+        w(f"{name:<25} | {status:<8} | {errors:<5} | {warnings:<8}\n")
 
     # 统计
     total = len(results)
-    valid = sum(1 for r in results if r['valid'])
-    invalid = total - valid
-
-    lines.append("-" * 55)
-    lines.append(f"Total: {total} | Valid: {valid} | Invalid: {invalid}")
+    w("-" * 55 + "\n")
+    w(f"Total: {total} | Valid: {valid} | Invalid: {total - valid}")
 
-    return '\n'.join(lines)
+    return buf.getvalue()
 
 
 def format_detail(results: List[Dict]) -> str:
     """格式化详细输出"""
-    lines = []
+    buf = io.StringIO()
+    w = buf.write
 
     invalid = [r for r in results if not r['valid']]
     with_warnings = [r for r in results if r['valid'] and r['warnings']]
 
     if invalid:
-        lines.append("=" * 50)
-        lines.append("INVALID SKILLS")
-        lines.append("=" * 50)
+        w("=" * 50 + "\n")
+        w("INVALID SKILLS\n")
+        w("=" * 50 + "\n")
 
         for r in invalid:
-            lines.append(f"\n{r['name']}:")
+            w(f"\n{r['name']}:\n")
             for err in r['errors']:
-                lines.append(f"  ❌ {err}")
+                w(f"  ❌ {err}\n")
             for warn in r['warnings']:
-                lines.append(f"  ⚠️ {warn}")
+                w(f"  ⚠️ {warn}\n")
 
     if with_warnings:
-        lines.append("\n" + "=" * 50)
-        lines.append("WARNINGS")
-        lines.append("=" * 50)
+        w("\n" + "=" * 50 + "\n")
+        w("WARNINGS\n")
+        w("=" * 50 + "\n")
 
         for r in with_warnings:
-            lines.append(f"\n{r['name']}:")
+            w(f"\n{r['name']}:\n")
             for warn in r['warnings']:
-                lines.append(f"  ⚠️ {warn}")
+                w(f"  ⚠️ {warn}\n")
 
     # 统计
     total = len(results)
-    valid = sum(1 for r in results if r['valid'])
+    valid = total - len(invalid)
+
+    w("\n" + "=" * 50 + "\n")
+    w(f"Summary: {valid}/{total} valid")
+
+    return buf.getvalue()
 
-    lines.append("\n" + "=" * 50)
-    lines.append(f"Summary: {valid}/{total} valid")
 
-    return '\n'.join(lines)
+def dump_json(obj) -> bytes:
+    """序列化为缩进 JSON（UTF-8 字节），有 orjson 时使用 orjson"""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def positive_int(value: str) -> int:
+    """argparse 参数类型：不小于 1 的整数"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"无效的整数: {value}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"必须不小于 1: {value}")
+    return number
 
 
 def main():
@@ -348,11 +384,13 @@ def main():
     parser.add_argument('--detail', action='store_true', help='显示详细错误信息')
     parser.add_argument('--strict', '-s', action='store_true', help='严格模式')
     parser.add_argument('--output', '-o', type=Path, help='输出到文件')
+    parser.add_argument('--workers', '-w', type=positive_int, default=None,
+                        help='并行进程数 (默认: CPU 核数)')
 
     args = parser.parse_args()
 
     # 验证
-    results = validate_all(args.skills_dir, strict=args.strict)
+    results = validate_all(args.skills_dir, strict=args.strict, max_workers=args.workers)
 
     if not results:
         print(f"未找到 Skills: {args.skills_dir}", file=sys.stderr)
@@ -360,18 +398,19 @@ def main():
 
     # 格式化
     if args.json:
-        output = json.dumps(results, indent=2, ensure_ascii=False)
+        output = dump_json(results)
     elif args.detail:
-        output = format_detail(results)
+        output = format_detail(results).encode('utf-8')
     else:
-        output = format_table(results)
+        output = format_table(results).encode('utf-8')
 
     # 输出
     if args.output:
-        args.output.write_text(output, encoding='utf-8')
+        args.output.write_bytes(output)
         print(f"已保存到: {args.output}")
     else:
-        print(output)
+        sys.stdout.flush()
+        sys.stdout.buffer.write(output + b"\n")
 
     # 退出码
     invalid_count = sum(1 for r in results if not r['valid'])
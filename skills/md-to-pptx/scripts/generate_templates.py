@@ -12,8 +12,11 @@ Each template contains slide layouts:
 - Image/Chart slide
 """
 
+import io
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple
 
 try:
     from pptx import Presentation
@@ -21,54 +24,97 @@ try:
     from pptx.dml.color import RGBColor
     from pptx.enum.text import PP_ALIGN
     from pptx.enum.shapes import MSO_SHAPE
+    from pptx_patches import fast_zip
 except ImportError:
     print("Error: python-pptx is required. Install with: pip install python-pptx")
     sys.exit(1)
 
 
+class TemplateColors(NamedTuple):
+    """Template name and pre-built colors."""
+    name: str
+    background: RGBColor
+    title_color: RGBColor
+    text_color: RGBColor
+    accent: RGBColor
+    secondary: RGBColor
+
+
 # Template configurations
 TEMPLATES = {
-    "business": {
-        "name": "Business Professional",
-        "background": (255, 255, 255),
-        "title_color": (44, 62, 80),
-        "text_color": (52, 73, 94),
-        "accent": (41, 128, 185),
-        "secondary": (236, 240, 241),
-    },
-    "tech_dark": {
-        "name": "Tech Dark",
-        "background": (30, 30, 30),
-        "title_color": (255, 255, 255),
-        "text_color": (220, 220, 220),
-        "accent": (0, 200, 150),
-        "secondary": (45, 45, 45),
-    },
-    "education": {
-        "name": "Education Bright",
-        "background": (255, 250, 240),
-        "title_color": (70, 130, 180),
-        "text_color": (60, 60, 60),
-        "accent": (255, 140, 0),
-        "secondary": (245, 245, 245),
-    },
+    "business": TemplateColors(
+        name="Business Professional",
+        background=RGBColor(255, 255, 255),
+        title_color=RGBColor(44, 62, 80),
+        text_color=RGBColor(52, 73, 94),
+        accent=RGBColor(41, 128, 185),
+        secondary=RGBColor(236, 240, 241),
+    ),
+    "tech_dark": TemplateColors(
+        name="Tech Dark",
+        background=RGBColor(30, 30, 30),
+        title_color=RGBColor(255, 255, 255),
+        text_color=RGBColor(220, 220, 220),
+        accent=RGBColor(0, 200, 150),
+        secondary=RGBColor(45, 45, 45),
+    ),
+    "education": TemplateColors(
+        name="Education Bright",
+        background=RGBColor(255, 250, 240),
+        title_color=RGBColor(70, 130, 180),
+        text_color=RGBColor(60, 60, 60),
+        accent=RGBColor(255, 140, 0),
+        secondary=RGBColor(245, 245, 245),
+    ),
 }
 
 
-def create_template(config: dict, output_path: str):
-    """Create a PPTX template with predefined layouts."""
+# Shared geometry, converted to EMU once at import time
+_SLIDE_W = Inches(13.333)
+_SLIDE_H = Inches(7.5)
+_ZERO = Inches(0)
+_TITLE_BAR_H = Inches(0.15)
+_BAR_H = Inches(0.08)
+_TITLE_BOX = (Inches(0.5), Inches(0.3), Inches(12.333), Inches(0.8))
+_CONTENT_TOP = Inches(1.3)
+_CONTENT_H = Inches(5.7)
+
+_PT18 = Pt(18)
+_PT24 = Pt(24)
+_PT36 = Pt(36)
+_PT44 = Pt(44)
+
+_BLANK_LAYOUT = 6
+
+
+def create_template(config: TemplateColors, output_path: str) -> io.BytesIO:
+    """
+    Create a PPTX template with predefined layouts.
+
+    The presentation is serialized into memory and written to disk in a
+    single call; the buffer is returned so callers can reuse the bytes.
+    """
     prs = Presentation()
-    prs.slide_width = Inches(13.333)
-    prs.slide_height = Inches(7.5)
+    prs.slide_width = _SLIDE_W
+    prs.slide_height = _SLIDE_H
+
+    # Look up the blank layout once and reuse it for every sample slide
+    blank = prs.slide_layouts[_BLANK_LAYOUT]
 
     # Create sample slides demonstrating each layout
-    _create_title_layout(prs, config)
-    _create_content_layout(prs, config)
-    _create_two_column_layout(prs, config)
-    _create_image_layout(prs, config)
+    _create_title_layout(prs, blank, config)
+    _create_content_layout(prs, blank, config)
+    _create_two_column_layout(prs, blank, config)
+    _create_image_layout(prs, blank, config)
+
+    buf = io.BytesIO()
+    with fast_zip():
+        prs.save(buf)
+    with buf.getbuffer() as data, open(output_path, 'wb') as f:
+        f.write(data)
 
-    prs.save(output_path)
     print(f"  Created: {output_path}")
+    return buf
 
 
 def _set_background(slide, color):
@@ -76,178 +122,109 @@ def _set_background(slide, color):
     background = slide.background
     fill = background.fill
     fill.solid()
-    fill.fore_color.rgb = RGBColor(*color)
+    fill.fore_color.rgb = color
+
+
+def _new_slide(prs, blank, config):
+    """Add a slide on the blank layout with the template background."""
+    slide = prs.slides.add_slide(blank)
+    _set_background(slide, config.background)
+    return slide
+
 
+def _add_rect(slide, geometry, color):
+    """Add a borderless filled rectangle."""
+    rect = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, *geometry)
+    rect.fill.solid()
+    rect.fill.fore_color.rgb = color
+    rect.line.fill.background()
+    return rect
 
-def _create_title_layout(prs, config):
+
+def _add_text(slide, geometry, text, size, color, bold=False,
+              alignment=None, word_wrap=False):
+    """Add a single-paragraph text box."""
+    box = slide.shapes.add_textbox(*geometry)
+    tf = box.text_frame
+    if word_wrap:
+        tf.word_wrap = True
+    p = tf.paragraphs[0]
+    p.text = text
+    p.font.size = size
+    if bold:
+        p.font.bold = True
+    p.font.color.rgb = color
+    if alignment is not None:
+        p.alignment = alignment
+    return box
+
+
+def _add_accent_bar_and_title(slide, config, title_text):
+    """Add the thin accent bar and title box shared by content layouts."""
+    _add_rect(slide, (_ZERO, _ZERO, _SLIDE_W, _BAR_H), config.accent)
+    _add_text(slide, _TITLE_BOX, title_text, _PT36, config.title_color, bold=True)
+
+
+def _create_title_layout(prs, blank, config):
     """Create title slide layout."""
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
-    _set_background(slide, config["background"])
+    slide = _new_slide(prs, blank, config)
 
     # Accent bar at top
-    bar = slide.shapes.add_shape(
-        MSO_SHAPE.RECTANGLE,
-        Inches(0), Inches(0),
-        Inches(13.333), Inches(0.15)
-    )
-    bar.fill.solid()
-    bar.fill.fore_color.rgb = RGBColor(*config["accent"])
-    bar.line.fill.background()
+    _add_rect(slide, (_ZERO, _ZERO, _SLIDE_W, _TITLE_BAR_H), config.accent)
 
     # Title placeholder
-    title_box = slide.shapes.add_textbox(
-        Inches(0.5), Inches(2.5),
-        Inches(12.333), Inches(1.5)
+    _add_text(
+        slide, (Inches(0.5), Inches(2.5), Inches(12.333), Inches(1.5)),
+        "[Title Slide]", _PT44, config.title_color,
+        bold=True, alignment=PP_ALIGN.CENTER
     )
-    tf = title_box.text_frame
-    p = tf.paragraphs[0]
-    p.text = "[Title Slide]"
-    p.font.size = Pt(44)
-    p.font.bold = True
-    p.font.color.rgb = RGBColor(*config["title_color"])
-    p.alignment = PP_ALIGN.CENTER
 
     # Subtitle placeholder
-    subtitle_box = slide.shapes.add_textbox(
-        Inches(0.5), Inches(4.2),
-        Inches(12.333), Inches(1)
+    _add_text(
+        slide, (Inches(0.5), Inches(4.2), Inches(12.333), Inches(1)),
+        "[Subtitle]", _PT24, config.text_color, alignment=PP_ALIGN.CENTER
     )
-    tf = subtitle_box.text_frame
-    p = tf.paragraphs[0]
-    p.text = "[Subtitle]"
-    p.font.size = Pt(24)
-    p.font.color.rgb = RGBColor(*config["text_color"])
-    p.alignment = PP_ALIGN.CENTER
 
 
-def _create_content_layout(prs, config):
+def _create_content_layout(prs, blank, config):
     """Create content slide layout."""
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
-    _set_background(slide, config["background"])
-
-    # Accent bar
-    bar = slide.shapes.add_shape(
-        MSO_SHAPE.RECTANGLE,
-        Inches(0), Inches(0),
-        Inches(13.333), Inches(0.08)
-    )
-    bar.fill.solid()
-    bar.fill.fore_color.rgb = RGBColor(*config["accent"])
-    bar.line.fill.background()
-
-    # Title area
-    title_box = slide.shapes.add_textbox(
-        Inches(0.5), Inches(0.3),
-        Inches(12.333), Inches(0.8)
-    )
-    tf = title_box.text_frame
-    p = tf.paragraphs[0]
-    p.text = "[Content Title]"
-    p.font.size = Pt(36)
-    p.font.bold = True
-    p.font.color.rgb = RGBColor(*config["title_color"])
+    slide = _new_slide(prs, blank, config)
+    _add_accent_bar_and_title(slide, config, "[Content Title]")
 
     # Content area
-    content_box = slide.shapes.add_textbox(
-        Inches(0.5), Inches(1.3),
-        Inches(12.333), Inches(5.7)
+    _add_text(
+        slide, (Inches(0.5), _CONTENT_TOP, Inches(12.333), _CONTENT_H),
+        "[Content Area - Bullet points, paragraphs, etc.]", _PT18, config.text_color,
+        word_wrap=True
     )
-    tf = content_box.text_frame
-    tf.word_wrap = True
-    p = tf.paragraphs[0]
-    p.text = "[Content Area - Bullet points, paragraphs, etc.]"
-    p.font.size = Pt(18)
-    p.font.color.rgb = RGBColor(*config["text_color"])
 
 
-def _create_two_column_layout(prs, config):
+def _create_two_column_layout(prs, blank, config):
     """Create two-column slide layout."""
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
-    _set_background(slide, config["background"])
-
-    # Accent bar
-    bar = slide.shapes.add_shape(
-        MSO_SHAPE.RECTANGLE,
-        Inches(0), Inches(0),
-        Inches(13.333), Inches(0.08)
-    )
-    bar.fill.solid()
-    bar.fill.fore_color.rgb = RGBColor(*config["accent"])
-    bar.line.fill.background()
-
-    # Title
-    title_box = slide.shapes.add_textbox(
-        Inches(0.5), Inches(0.3),
-        Inches(12.333), Inches(0.8)
-    )
-    tf = title_box.text_frame
-    p = tf.paragraphs[0]
-    p.text = "[Two Column Title]"
-    p.font.size = Pt(36)
-    p.font.bold = True
-    p.font.color.rgb = RGBColor(*config["title_color"])
+    slide = _new_slide(prs, blank, config)
+    _add_accent_bar_and_title(slide, config, "[Two Column Title]")
 
     # Left column
-    left_box = slide.shapes.add_textbox(
-        Inches(0.5), Inches(1.3),
-        Inches(5.9), Inches(5.7)
+    _add_text(
+        slide, (Inches(0.5), _CONTENT_TOP, Inches(5.9), _CONTENT_H),
+        "[Left Column]", _PT18, config.text_color, word_wrap=True
     )
-    tf = left_box.text_frame
-    tf.word_wrap = True
-    p = tf.paragraphs[0]
-    p.text = "[Left Column]"
-    p.font.size = Pt(18)
-    p.font.color.rgb = RGBColor(*config["text_color"])
 
     # Divider
-    divider = slide.shapes.add_shape(
-        MSO_SHAPE.RECTANGLE,
-        Inches(6.55), Inches(1.3),
-        Inches(0.02), Inches(5.7)
-    )
-    divider.fill.solid()
-    divider.fill.fore_color.rgb = RGBColor(*config["secondary"])
-    divider.line.fill.background()
+    _add_rect(slide, (Inches(6.55), _CONTENT_TOP, Inches(0.02), _CONTENT_H),
+              config.secondary)
 
     # Right column
-    right_box = slide.shapes.add_textbox(
-        Inches(6.9), Inches(1.3),
-        Inches(5.9), Inches(5.7)
+    _add_text(
+        slide, (Inches(6.9), _CONTENT_TOP, Inches(5.9), _CONTENT_H),
+        "[Right Column]", _PT18, config.text_color, word_wrap=True
     )
-    tf = right_box.text_frame
-    tf.word_wrap = True
-    p = tf.paragraphs[0]
-    p.text = "[Right Column]"
-    p.font.size = Pt(18)
-    p.font.color.rgb = RGBColor(*config["text_color"])
 
 
-def _create_image_layout(prs, config):
+def _create_image_layout(prs, blank, config):
     """Create image/chart focused slide layout."""
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
-    _set_background(slide, config["background"])
-
-    # Accent bar
-    bar = slide.shapes.add_shape(
-        MSO_SHAPE.RECTANGLE,
-        Inches(0), Inches(0),
-        Inches(13.333), Inches(0.08)
-    )
-    bar.fill.solid()
-    bar.fill.fore_color.rgb = RGBColor(*config["accent"])
-    bar.line.fill.background()
-
-    # Title
-    title_box = slide.shapes.add_textbox(
-        Inches(0.5), Inches(0.3),
-        Inches(12.333), Inches(0.8)
-    )
-    tf = title_box.text_frame
-    p = tf.paragraphs[0]
-    p.text = "[Image/Chart Title]"
-    p.font.size = Pt(36)
-    p.font.bold = True
-    p.font.color.rgb = RGBColor(*config["title_color"])
+    slide = _new_slide(prs, blank, config)
+    _add_accent_bar_and_title(slide, config, "[Image/Chart Title]")
 
     # Image placeholder area
     img_area = slide.shapes.add_shape(
@@ -256,32 +233,41 @@ def _create_image_layout(prs, config):
         Inches(10.333), Inches(5)
     )
     img_area.fill.solid()
-    img_area.fill.fore_color.rgb = RGBColor(*config["secondary"])
-    img_area.line.color.rgb = RGBColor(*config["accent"])
+    img_area.fill.fore_color.rgb = config.secondary
+    img_area.line.color.rgb = config.accent
 
     # Placeholder text
-    placeholder = slide.shapes.add_textbox(
-        Inches(4), Inches(3.5),
-        Inches(5.333), Inches(1)
+    _add_text(
+        slide, (Inches(4), Inches(3.5), Inches(5.333), Inches(1)),
+        "[Image or Chart Area]", _PT24, config.text_color, alignment=PP_ALIGN.CENTER
     )
-    tf = placeholder.text_frame
-    p = tf.paragraphs[0]
-    p.text = "[Image or Chart Area]"
-    p.font.size = Pt(24)
-    p.font.color.rgb = RGBColor(*config["text_color"])
-    p.alignment = PP_ALIGN.CENTER
+
+
+def _generate_template_worker(job):
+    """Process-pool entry point: build one template file."""
+    # Only the name crosses the process boundary; RGBColor does not pickle
+    name, output_dir = job
+    output_path = os.path.join(output_dir, f"{name}_template.pptx")
+    create_template(TEMPLATES[name], output_path)
+    return output_path
 
 
 def generate_all_templates(output_dir: str):
-    """Generate all built-in templates."""
+    """Generate all built-in templates (one process per template)."""
     os.makedirs(output_dir, exist_ok=True)
 
     print(f"Generating templates in: {output_dir}")
     print("-" * 40)
+    sys.stdout.flush()
 
-    for name, config in TEMPLATES.items():
-        output_path = os.path.join(output_dir, f"{name}_template.pptx")
-        create_template(config, output_path)
+    jobs = [(name, output_dir) for name in TEMPLATES]
+    max_workers = min(len(jobs), os.cpu_count() or 1)
+    if max_workers > 1:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(_generate_template_worker, jobs))
+    else:
+        for job in jobs:
+            _generate_template_worker(job)
 
     print("-" * 40)
     print(f"Generated {len(TEMPLATES)} templates")
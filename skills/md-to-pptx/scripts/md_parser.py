@@ -7,11 +7,95 @@ Supports: headings, paragraphs, lists, code blocks, tables, images.
 """
 
 import re
+import sys
 from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Any
 from enum import Enum
 
 
+# Per-instance __dict__ is dropped where dataclass slots are available (3.10+)
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Precompiled image pattern (other line types use the prefix tests below)
+_RE_IMAGE = re.compile(r'!\[([^\]]*)\]\(([^)]+)\)')
+
+
+def _match_heading(line: str) -> Optional[tuple]:
+    """Prefix test equivalent to ``^(#{1,6})\\s+(.+)$``; returns (level, text)."""
+    # Seven '#' already rule out a heading, so never scan further
+    level = 0
+    n = min(len(line), 7)
+    while level < n and line[level] == '#':
+        level += 1
+    if not 1 <= level <= 6 or len(line) < level + 2 or not line[level].isspace():
+        return None
+    return level, line[level:].strip()
+
+
+def _is_bullet(line: str) -> bool:
+    """Prefix test equivalent to ``^\\s*[-*+]\\s+``."""
+    s = line.lstrip()
+    return len(s) > 1 and s[0] in '-*+' and s[1].isspace()
+
+
+def _match_bullet(line: str) -> Optional[tuple]:
+    """Prefix test equivalent to ``^(\\s*)[-*+]\\s+(.+)$``; returns (indent, text)."""
+    s = line.lstrip()
+    if len(s) > 2 and s[0] in '-*+' and s[1].isspace():
+        return len(line) - len(s), s[1:].strip()
+    return None
+
+
+def _numbered_marker_end(s: str) -> int:
+    """Return the index of the '.' after the leading digits of s, or 0."""
+    j = 0
+    n = len(s)
+    while j < n and s[j].isdecimal():
+        j += 1
+    return j if 0 < j < n and s[j] == '.' else 0
+
+
+def _match_numbered(line: str) -> Optional[tuple]:
+    """Prefix test equivalent to ``^(\\s*)\\d+\\.\\s+(.+)$``; returns (indent, text)."""
+    s = line.lstrip()
+    j = _numbered_marker_end(s)
+    if j and len(s) > j + 2 and s[j + 1].isspace():
+        return len(line) - len(s), s[j + 1:].strip()
+    return None
+
+
+def _is_numbered(line: str) -> bool:
+    """Prefix test equivalent to ``^\\s*\\d+\\.\\s+``."""
+    s = line.lstrip()
+    j = _numbered_marker_end(s)
+    return j > 0 and j + 1 < len(s) and s[j + 1].isspace()
+
+
+def _is_table_separator(line: str, require_pipe: bool = True) -> bool:
+    """
+    Prefix test equivalent to ``^\\s*\\|?\\s*[-:]+\\s*\\|``.
+
+    With require_pipe=False the trailing ``\\s*\\|`` is not required.
+    """
+    s = line.lstrip()
+    if s.startswith('|'):
+        s = s[1:].lstrip()
+    rest = s.lstrip('-:')
+    if len(rest) == len(s):
+        return False
+    return not require_pipe or rest.lstrip().startswith('|')
+
+
+def _split_row(line: str) -> List[str]:
+    """Split a table row into stripped cells, dropping one outer pipe on each side."""
+    line = line.strip()
+    if line.startswith('|'):
+        line = line[1:]
+    if line.endswith('|'):
+        line = line[:-1]
+    return [cell.strip() for cell in line.split('|')]
+
+
 class ContentType(Enum):
     """Types of content elements."""
     HEADING = "heading"
@@ -24,15 +108,15 @@ class ContentType(Enum):
     CHART_DATA = "chart_data"
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ContentElement:
     """Represents a single content element."""
     type: ContentType
     content: Any
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    metadata: Optional[Dict[str, Any]] = None  # only set by elements that carry extras
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class SlideData:
     """Represents data for a single slide."""
     title: str = ""
@@ -40,15 +124,23 @@ class SlideData:
     elements: List[ContentElement] = field(default_factory=list)
     layout_hint: str = "content"  # title, content, two_column, image, chart
     notes: str = ""
+    # Content flags maintained as elements are added (used for layout hints)
+    _has_image: bool = field(default=False, repr=False)
+    _has_table: bool = field(default=False, repr=False)
+    _has_chart: bool = field(default=False, repr=False)
+    _has_code: bool = field(default=False, repr=False)
 
 
 class MarkdownParser:
     """Parse Markdown content into structured slide data."""
 
+    __slots__ = ('slides', 'current_slide', 'warnings', '_implicit_first')
+
     def __init__(self):
         self.slides: List[SlideData] = []
         self.current_slide: Optional[SlideData] = None
         self.warnings: List[str] = []
+        self._implicit_first = False
 
     def parse(self, markdown_text: str) -> List[SlideData]:
         """
@@ -61,62 +153,78 @@ class MarkdownParser:
             List of SlideData objects representing slides
         """
         self.slides = []
-        self.current_slide = None
         self.warnings = []
 
-        lines = markdown_text.split('\n')
+        # Content before the first H1/H2 lands on an implicit "Untitled"
+        # slide, created up front so element handlers need no None check
+        self.current_slide = SlideData(title="Untitled")
+        self._implicit_first = True
+
+        lines = markdown_text.splitlines()
+        n = len(lines)
         i = 0
 
-        while i < len(lines):
+        while i < n:
             line = lines[i]
+            stripped = line.strip()
+
+            if not stripped:
+                i += 1
+                continue
 
             # Check for code block
-            if line.strip().startswith('```'):
-                i = self._parse_code_block(lines, i)
+            if stripped.startswith('```'):
+                i = self._parse_code_block(lines, i, n)
                 continue
 
-            # Check for table
-            if '|' in line and i + 1 < len(lines) and '|' in lines[i + 1]:
-                if re.match(r'^\s*\|?\s*[-:]+\s*\|', lines[i + 1]):
-                    i = self._parse_table(lines, i)
+            # Check for table (header row may contain '|' anywhere)
+            if '|' in line and i + 1 < n and '|' in lines[i + 1]:
+                if _is_table_separator(lines[i + 1]):
+                    i = self._parse_table(lines, i, n)
                     continue
 
-            # Check for heading
-            heading_match = re.match(r'^(#{1,6})\s+(.+)$', line)
-            if heading_match:
-                level = len(heading_match.group(1))
-                text = heading_match.group(2).strip()
-                self._handle_heading(level, text)
-                i += 1
-                continue
+            # Dispatch on the first non-space character so that plain
+            # prose lines never reach the regex engine
+            c = stripped[0]
 
-            # Check for image
-            img_match = re.match(r'!\[([^\]]*)\]\(([^)]+)\)', line.strip())
-            if img_match:
-                alt_text = img_match.group(1)
-                img_path = img_match.group(2)
-                self._add_image(img_path, alt_text)
-                i += 1
-                continue
+            if c == '#':
+                # Check for heading
+                heading = _match_heading(line)
+                if heading:
+                    self._handle_heading(*heading)
+                    i += 1
+                    continue
 
-            # Check for bullet list
-            if re.match(r'^\s*[-*+]\s+', line):
-                i = self._parse_bullet_list(lines, i)
-                continue
+            elif c == '!':
+                # Check for image
+                img_match = _RE_IMAGE.match(stripped)
+                if img_match:
+                    alt_text = img_match.group(1)
+                    img_path = img_match.group(2)
+                    self._add_image(img_path, alt_text)
+                    i += 1
+                    continue
 
-            # Check for numbered list
-            if re.match(r'^\s*\d+\.\s+', line):
-                i = self._parse_numbered_list(lines, i)
-                continue
+            elif c in '-*+':
+                # Check for bullet list
+                if _is_bullet(line):
+                    i = self._parse_list(lines, i, n, _match_bullet, _is_bullet,
+                                         ContentType.BULLET_LIST)
+                    continue
 
-            # Regular paragraph
-            if line.strip():
-                self._add_paragraph(line.strip())
+            elif c.isdigit():
+                # Check for numbered list
+                if _is_numbered(line):
+                    i = self._parse_list(lines, i, n, _match_numbered, _is_numbered,
+                                         ContentType.NUMBERED_LIST)
+                    continue
 
+            # Regular paragraph
+            self._add_paragraph(stripped)
             i += 1
 
-        # Finalize last slide
-        if self.current_slide:
+        # Finalize last slide (an untouched implicit slide is dropped)
+        if not self._implicit_first or self.current_slide.elements:
             self.slides.append(self.current_slide)
 
         # Post-process: determine layout hints
@@ -124,17 +232,13 @@ class MarkdownParser:
 
         return self.slides
 
-    def _ensure_slide(self):
-        """Ensure there's a current slide to add content to."""
-        if self.current_slide is None:
-            self.current_slide = SlideData(title="Untitled")
-
     def _handle_heading(self, level: int, text: str):
         """Handle heading elements - create new slides for H1/H2."""
         if level <= 2:
-            # Start new slide
-            if self.current_slide:
+            # Start new slide, keeping the implicit first slide only if used
+            if not self._implicit_first or self.current_slide.elements:
                 self.slides.append(self.current_slide)
+            self._implicit_first = False
 
             self.current_slide = SlideData(title=text)
 
@@ -142,7 +246,6 @@ class MarkdownParser:
                 self.current_slide.layout_hint = "title"
         else:
             # Add as content heading
-            self._ensure_slide()
             self.current_slide.elements.append(ContentElement(
                 type=ContentType.HEADING,
                 content=text,
@@ -151,8 +254,6 @@ class MarkdownParser:
 
     def _add_paragraph(self, text: str):
         """Add paragraph content."""
-        self._ensure_slide()
-
         # Check if this looks like a subtitle (first content after title slide)
         if (self.current_slide.layout_hint == "title" and
             not self.current_slide.subtitle and
@@ -166,65 +267,41 @@ class MarkdownParser:
 
     def _add_image(self, path: str, alt_text: str = ""):
         """Add image content."""
-        self._ensure_slide()
-
         # Only support local images
         if path.startswith(('http://', 'https://', 'data:')):
             self.warnings.append(f"Skipped non-local image: {path}")
+            # The slide is still emitted even though nothing was added
+            self._implicit_first = False
             return
 
+        self.current_slide._has_image = True
         self.current_slide.elements.append(ContentElement(
             type=ContentType.IMAGE,
             content=path,
             metadata={"alt_text": alt_text}
         ))
 
-    def _parse_bullet_list(self, lines: List[str], start: int) -> int:
-        """Parse bullet list and return next line index."""
-        self._ensure_slide()
-        items = []
-        i = start
-
-        while i < len(lines):
-            match = re.match(r'^(\s*)[-*+]\s+(.+)$', lines[i])
-            if match:
-                indent = len(match.group(1))
-                text = match.group(2).strip()
-                items.append({"text": text, "indent": indent // 2})
-                i += 1
-            elif lines[i].strip() == "":
-                i += 1
-                # Check if list continues
-                if i < len(lines) and re.match(r'^\s*[-*+]\s+', lines[i]):
-                    continue
-                break
-            else:
-                break
-
-        if items:
-            self.current_slide.elements.append(ContentElement(
-                type=ContentType.BULLET_LIST,
-                content=items
-            ))
-
-        return i
+    def _parse_list(self, lines: List[str], start: int, n: int,
+                    match_item, is_item, list_type: ContentType) -> int:
+        """
+        Parse a bullet or numbered list and return next line index.
 
-    def _parse_numbered_list(self, lines: List[str], start: int) -> int:
-        """Parse numbered list and return next line index."""
-        self._ensure_slide()
+        match_item returns (indent, text) for an item line; is_item tells
+        whether the line after a blank one continues the list.
+        """
         items = []
         i = start
 
-        while i < len(lines):
-            match = re.match(r'^(\s*)\d+\.\s+(.+)$', lines[i])
+        while i < n:
+            match = match_item(lines[i])
             if match:
-                indent = len(match.group(1))
-                text = match.group(2).strip()
+                indent, text = match
                 items.append({"text": text, "indent": indent // 2})
                 i += 1
             elif lines[i].strip() == "":
                 i += 1
-                if i < len(lines) and re.match(r'^\s*\d+\.\s+', lines[i]):
+                # Check if list continues
+                if i < n and is_item(lines[i]):
                     continue
                 break
             else:
@@ -232,74 +309,54 @@ class MarkdownParser:
 
         if items:
             self.current_slide.elements.append(ContentElement(
-                type=ContentType.NUMBERED_LIST,
+                type=list_type,
                 content=items
             ))
 
         return i
 
-    def _parse_code_block(self, lines: List[str], start: int) -> int:
+    def _parse_code_block(self, lines: List[str], start: int, n: int) -> int:
         """Parse code block and return next line index."""
-        self._ensure_slide()
-
         # Extract language from opening fence
-        first_line = lines[start].strip()
-        language = first_line[3:].strip() if len(first_line) > 3 else ""
+        fence = lines[start].lstrip()
+        language = fence[3:].strip() if len(fence) > 3 else ""
 
-        code_lines = []
-        i = start + 1
-
-        while i < len(lines):
-            if lines[i].strip().startswith('```'):
-                i += 1
-                break
-            code_lines.append(lines[i])
-            i += 1
+        # Locate the closing fence, then take the body as one slice
+        end = start + 1
+        while end < n and not lines[end].lstrip().startswith('```'):
+            end += 1
 
+        self.current_slide._has_code = True
         self.current_slide.elements.append(ContentElement(
             type=ContentType.CODE_BLOCK,
-            content='\n'.join(code_lines),
+            content='\n'.join(lines[start + 1:end]),
             metadata={"language": language}
         ))
 
-        return i
+        return end + 1 if end < n else end
 
-    def _parse_table(self, lines: List[str], start: int) -> int:
+    def _parse_table(self, lines: List[str], start: int, n: int) -> int:
         """Parse Markdown table and return next line index."""
-        self._ensure_slide()
-
-        headers = []
         rows = []
         i = start
 
         # Parse header row
-        header_line = lines[i].strip()
-        if header_line.startswith('|'):
-            header_line = header_line[1:]
-        if header_line.endswith('|'):
-            header_line = header_line[:-1]
-        headers = [cell.strip() for cell in header_line.split('|')]
+        headers = _split_row(lines[i])
         i += 1
 
         # Skip separator row
-        if i < len(lines) and re.match(r'^\s*\|?\s*[-:]+', lines[i]):
+        if i < n and _is_table_separator(lines[i], require_pipe=False):
             i += 1
 
         # Parse data rows
-        while i < len(lines):
-            line = lines[i].strip()
-            if not line or not '|' in line:
+        while i < n:
+            line = lines[i]
+            if '|' not in line:
                 break
-
-            if line.startswith('|'):
-                line = line[1:]
-            if line.endswith('|'):
-                line = line[:-1]
-
-            cells = [cell.strip() for cell in line.split('|')]
-            rows.append(cells)
+            rows.append(_split_row(line))
             i += 1
 
+        self.current_slide._has_table = True
         self.current_slide.elements.append(ContentElement(
             type=ContentType.TABLE,
             content={"headers": headers, "rows": rows}
@@ -313,18 +370,13 @@ class MarkdownParser:
             if slide.layout_hint == "title":
                 continue
 
-            has_image = any(e.type == ContentType.IMAGE for e in slide.elements)
-            has_table = any(e.type == ContentType.TABLE for e in slide.elements)
-            has_chart = any(e.type == ContentType.CHART_DATA for e in slide.elements)
-            has_code = any(e.type == ContentType.CODE_BLOCK for e in slide.elements)
-
             element_count = len(slide.elements)
 
-            if has_chart:
+            if slide._has_chart:
                 slide.layout_hint = "chart"
-            elif has_image and element_count <= 3:
+            elif slide._has_image and element_count <= 3:
                 slide.layout_hint = "image"
-            elif has_table or has_code:
+            elif slide._has_table or slide._has_code:
                 slide.layout_hint = "content"
             elif element_count > 4:
                 slide.layout_hint = "two_column"
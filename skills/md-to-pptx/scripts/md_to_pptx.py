@@ -12,44 +12,114 @@ Usage:
 """
 
 import argparse
+import concurrent.futures
+import functools
+import mmap
 import os
 import sys
+import time
+from pathlib import Path, PurePath
+from types import MappingProxyType
 from typing import Optional, List, Tuple
 
 # Add script directory to path for imports
 script_dir = os.path.dirname(os.path.abspath(__file__))
 skill_dir = os.path.dirname(script_dir)
+templates_dir = os.path.join(skill_dir, "assets", "templates")
 if script_dir not in sys.path:
     sys.path.insert(0, script_dir)
 
+# pptx_generator (and python-pptx) is imported only when generating, so
+# --help and the listing commands start without it
 from md_parser import parse_markdown, SlideData
-from pptx_generator import generate_pptx, THEMES
-
-# Built-in template paths
-BUILTIN_TEMPLATES = {
-    "business": os.path.join(skill_dir, "assets", "templates", "business_template.pptx"),
-    "tech_dark": os.path.join(skill_dir, "assets", "templates", "tech_dark_template.pptx"),
-    "education": os.path.join(skill_dir, "assets", "templates", "education_template.pptx"),
-    "neumorphism": os.path.join(skill_dir, "assets", "templates", "蓝黄色新拟态行业调研报告PPT模板.pptx"),
+from themes import THEMES
+
+# Built-in template file names (read-only)
+_TEMPLATE_BASENAMES = MappingProxyType({
+    "business": "business_template.pptx",
+    "tech_dark": "tech_dark_template.pptx",
+    "education": "education_template.pptx",
+    "neumorphism": "蓝黄色新拟态行业调研报告PPT模板.pptx",
+})
+
+# Built-in template paths (read-only)
+BUILTIN_TEMPLATES = MappingProxyType({
+    name: os.path.join(templates_dir, filename)
+    for name, filename in _TEMPLATE_BASENAMES.items()
+})
+
+# Built-in templates present on disk, resolved once at import
+_BUILTIN_TEMPLATES_RESOLVED = {
+    name: path for name, path in BUILTIN_TEMPLATES.items() if os.path.exists(path)
 }
 
 
+# Number of parsed documents kept for repeated conversions of the same content
+PARSE_CACHE_SIZE = 64
+
+
+@functools.lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_cached(md_content: str) -> Tuple[List[SlideData], List[str]]:
+    """
+    Parse Markdown content, reusing the result for identical input.
+
+    The returned slides and warnings are shared between callers and must
+    be treated as read-only (the generator only reads them).
+    """
+    return parse_markdown(md_content)
+
+
+# Progress bar rendering
+PROGRESS_BAR_WIDTH = 30
+PROGRESS_MIN_INTERVAL = 1 / 30  # seconds between intermediate redraws
+_BAR_FULL = '█' * PROGRESS_BAR_WIDTH
+_BAR_EMPTY = '░' * PROGRESS_BAR_WIDTH
+_last_progress_emit = 0.0
+
+
 def print_progress(current: int, total: int, message: str):
-    """Print progress to console."""
-    bar_width = 30
-    filled = int(bar_width * current / total)
-    bar = '█' * filled + '░' * (bar_width - filled)
-    print(f"\r[{bar}] {current}/{total} - {message}", end='', flush=True)
+    """
+    Print progress to console (intermediate frames limited to ~30 per second).
+
+    Carriage-return redraws are only useful on a terminal, so nothing is
+    written when stdout is redirected to a file or pipe.
+    """
+    global _last_progress_emit
+    out = sys.stdout
+    if not out.isatty():
+        return
+
+    now = time.monotonic()
+    if current != total and now - _last_progress_emit < PROGRESS_MIN_INTERVAL:
+        return
+    _last_progress_emit = now
+
+    filled = int(PROGRESS_BAR_WIDTH * current / total)
+    bar = _BAR_FULL[:filled] + _BAR_EMPTY[filled:]
+    line = f"\r[{bar}] {current}/{total} - {message}"
     if current == total:
-        print()  # New line at completion
+        line += "\n"  # New line at completion
+
+    # One encoded write on the binary layer; flush pending text first so
+    # earlier print() output stays in order
+    buffer = getattr(out, "buffer", None)
+    if buffer is None:
+        out.write(line)
+        out.flush()
+        return
+    out.flush()
+    buffer.write(line.encode(out.encoding or "utf-8", out.errors or "strict"))
+    buffer.flush()
+
+
+def default_output_name(input_path: str) -> str:
+    """Default PPTX file name for an input file (input stem + .pptx)."""
+    return f"{PurePath(input_path).stem}.pptx"
 
 
 def get_builtin_template(theme: str) -> Optional[str]:
     """Get path to built-in template for a theme."""
-    template_path = BUILTIN_TEMPLATES.get(theme)
-    if template_path and os.path.exists(template_path):
-        return template_path
-    return None
+    return _BUILTIN_TEMPLATES_RESOLVED.get(theme)
 
 
 def convert_md_to_pptx(
@@ -82,13 +152,18 @@ def convert_md_to_pptx(
 
     # Determine output path
     if output_path is None:
-        base_name = os.path.splitext(os.path.basename(input_path))[0]
-        output_path = f"{base_name}.pptx"
+        output_path = default_output_name(input_path)
 
-    # Read Markdown content
+    # Read Markdown content: decode straight from a read-only mapping so the
+    # file bytes are not copied into an intermediate buffer first
+    # (mmap rejects empty files, which simply yield no slides)
     try:
-        with open(input_path, 'r', encoding='utf-8') as f:
-            md_content = f.read()
+        with open(input_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    md_content = str(mm, 'utf-8')
+            else:
+                md_content = ""
     except Exception as e:
         return False, "", [f"Failed to read input file: {str(e)}"]
 
@@ -96,7 +171,7 @@ def convert_md_to_pptx(
         print(f"📄 Reading: {input_path}")
 
     # Parse Markdown
-    slides, parse_warnings = parse_markdown(md_content)
+    slides, parse_warnings = _parse_cached(md_content)
     warnings.extend(parse_warnings)
 
     if not slides:
@@ -114,9 +189,10 @@ def convert_md_to_pptx(
     elif use_builtin_template:
         actual_template = get_builtin_template(theme)
         if actual_template and verbose:
-            print(f"📋 Using built-in template: {os.path.basename(actual_template)}")
+            print(f"📋 Using built-in template: {_TEMPLATE_BASENAMES[theme]}")
 
     # Generate PPTX
+    from pptx_generator import generate_pptx
     progress_cb = print_progress if verbose else None
     success, gen_warnings = generate_pptx(
         slides,
@@ -158,7 +234,7 @@ def generate_from_content(
     warnings = []
 
     # Parse content
-    slides, parse_warnings = parse_markdown(content)
+    slides, parse_warnings = _parse_cached(content)
     warnings.extend(parse_warnings)
 
     if not slides:
@@ -173,6 +249,7 @@ def generate_from_content(
         actual_template = get_builtin_template(theme)
 
     # Generate PPTX
+    from pptx_generator import generate_pptx
     progress_cb = print_progress if verbose else None
     success, gen_warnings = generate_pptx(
         slides,
@@ -191,8 +268,7 @@ def list_themes():
     print("\n📎 Available themes:")
     print("-" * 50)
     for name, config in THEMES.items():
-        template_path = BUILTIN_TEMPLATES.get(name)
-        has_template = template_path and os.path.exists(template_path)
+        has_template = name in _BUILTIN_TEMPLATES_RESOLVED
         template_status = "✅ Template available" if has_template else "⚠️  No template"
 
         print(f"  {name:12} - {config.name}")
@@ -205,17 +281,48 @@ def list_templates():
     print("\n📋 Built-in templates:")
     print("-" * 50)
     for name, path in BUILTIN_TEMPLATES.items():
-        exists = os.path.exists(path)
-        status = "✅" if exists else "❌"
+        status = "✅" if name in _BUILTIN_TEMPLATES_RESOLVED else "❌"
         print(f"  {status} {name:12} -> {path}")
 
     print("\n📁 Custom template location:")
-    print(f"   Place your .pptx templates in: {os.path.join(skill_dir, 'assets', 'templates')}")
+    print(f"   Place your .pptx templates in: {templates_dir}")
     print("   Or specify path with --template option")
 
 
-def main():
-    """Main entry point."""
+def _convert_worker(task: Tuple) -> Tuple[str, bool, str, List[str]]:
+    """Process-pool entry point: convert one file without progress output."""
+    input_path = task[0]
+    success, final_path, warnings = convert_md_to_pptx(*task, verbose=False)
+    return input_path, success, final_path, warnings
+
+
+def _convert_batch(tasks: List[Tuple], quiet: bool = False) -> int:
+    """Convert several files in parallel, one process per file."""
+    max_workers = min(len(tasks), os.cpu_count() or 1)
+    failed = 0
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
+        for input_path, success, final_path, warnings in executor.map(_convert_worker, tasks):
+            if success:
+                if not quiet:
+                    print(f"✅ Created: {os.path.abspath(final_path)}")
+            else:
+                failed += 1
+                print(f"❌ Failed: {input_path}")
+
+            if warnings and not quiet:
+                for w in warnings:
+                    print(f"   ⚠️  {w}")
+
+    if not quiet:
+        print(f"\n📊 Converted {len(tasks) - failed}/{len(tasks)} files")
+
+    return 0 if failed == 0 else 1
+
+
+@functools.lru_cache(maxsize=None)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI argument parser (once per process)."""
     parser = argparse.ArgumentParser(
         description="Convert Markdown to PowerPoint presentation",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -226,6 +333,7 @@ Examples:
   %(prog)s presentation.md -d ~/Desktop       # Save to Desktop
   %(prog)s presentation.md --theme tech_dark  # Use tech dark theme
   %(prog)s presentation.md --template my.pptx # Use custom template
+  %(prog)s a.md b.md c.md -d out              # Convert several files in parallel
   %(prog)s --list-themes                      # Show available themes
   %(prog)s --list-templates                   # Show template locations
         """
@@ -233,8 +341,8 @@ Examples:
 
     parser.add_argument(
         "input",
-        nargs="?",
-        help="Input Markdown file path"
+        nargs="*",
+        help="Input Markdown file path(s)"
     )
     parser.add_argument(
         "-o", "--output",
@@ -276,6 +384,12 @@ Examples:
         help="List template locations and exit"
     )
 
+    return parser
+
+
+def main():
+    """Main entry point."""
+    parser = _build_parser()
     args = parser.parse_args()
 
     # Handle list commands
@@ -292,60 +406,63 @@ Examples:
         parser.print_help()
         return 1
 
+    if args.output and len(args.input) > 1:
+        parser.error("-o/--output can only be used with a single input file")
+
     # Get the original working directory (where user invoked the command)
     # This ensures output goes to user's directory, not skill's directory
-    original_cwd = os.getcwd()
-
-    # Determine output path
-    output_path = args.output
-    if output_path is None:
-        base_name = os.path.splitext(os.path.basename(args.input))[0]
-        output_path = f"{base_name}.pptx"
+    original_cwd = Path.cwd()
 
     # Apply directory - default to original working directory
+    # (joining an absolute directory onto the cwd yields that directory)
     if args.directory and args.directory != ".":
-        # User specified a directory
-        output_dir = os.path.expanduser(args.directory)
-        if not os.path.isabs(output_dir):
-            output_dir = os.path.join(original_cwd, output_dir)
+        output_dir = original_cwd / Path(args.directory).expanduser()
     else:
-        # Default: use original working directory (user's current directory)
         output_dir = original_cwd
 
     # Create directory if needed
-    if not os.path.exists(output_dir):
-        try:
-            os.makedirs(output_dir)
-        except Exception as e:
-            print(f"❌ Cannot create directory: {output_dir}")
-            return 1
-
-    # Make output path absolute
-    if not os.path.isabs(output_path):
-        output_path = os.path.join(output_dir, os.path.basename(output_path))
-
-    # Make input path absolute relative to original cwd
-    input_path = args.input
-    if not os.path.isabs(input_path):
-        input_path = os.path.join(original_cwd, input_path)
-
-    # Convert
-    success, final_path, warnings = convert_md_to_pptx(
-        input_path,
-        output_path,
-        theme=args.theme,
-        template_path=args.template,
-        use_builtin_template=not args.no_template,
-        verbose=not args.quiet
-    )
-
-    # Print warnings
-    if warnings and not args.quiet:
-        print("\n⚠️  Warnings:")
-        for w in warnings:
-            print(f"   - {w}")
+    try:
+        output_dir.mkdir(parents=True, exist_ok=True)
+    except Exception as e:
+        print(f"❌ Cannot create directory: {output_dir}")
+        return 1
 
-    return 0 if success else 1
+    tasks = []
+    seen_outputs = {}
+    for input_path in args.input:
+        # Determine output path
+        output_path = args.output or default_output_name(input_path)
+
+        # Make output path absolute
+        if not os.path.isabs(output_path):
+            output_path = output_dir / Path(output_path).name
+
+        # Parallel workers writing the same file would lose or corrupt a deck
+        key = os.path.normcase(os.path.abspath(output_path))
+        if key in seen_outputs:
+            parser.error(f"{seen_outputs[key]} and {input_path} would both write {output_path}")
+        seen_outputs[key] = input_path
+
+        # Make input path absolute relative to original cwd
+        tasks.append((str(original_cwd / input_path), str(output_path), args.theme,
+                      args.template, not args.no_template))
+
+    if len(tasks) == 1:
+        # Convert
+        success, final_path, warnings = convert_md_to_pptx(
+            *tasks[0],
+            verbose=not args.quiet
+        )
+
+        # Print warnings
+        if warnings and not args.quiet:
+            print("\n⚠️  Warnings:")
+            for w in warnings:
+                print(f"   - {w}")
+
+        return 0 if success else 1
+
+    return _convert_batch(tasks, quiet=args.quiet)
 
 
 if __name__ == "__main__":
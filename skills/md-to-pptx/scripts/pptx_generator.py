@@ -6,111 +6,172 @@ Generates PowerPoint presentations from structured slide data.
 Supports: text, lists, code blocks, tables, images, and charts.
 """
 
+import hashlib
+import io
 import os
-from typing import List, Dict, Any, Optional, Tuple
-from dataclasses import dataclass
-from enum import Enum
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Tuple
 
 try:
     from pptx import Presentation
     from pptx.util import Inches, Pt
     from pptx.dml.color import RGBColor
-    from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
-    from pptx.enum.shapes import MSO_SHAPE
-    from pptx.enum.chart import XL_CHART_TYPE
-    from pptx.chart.data import CategoryChartData
+    from pptx.enum.text import MSO_ANCHOR
+    from pptx.enum.shapes import MSO_SHAPE, PP_PLACEHOLDER
+    from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+    from pptx.opc.packuri import PackURI
+    from pptx.oxml import parse_xml
+    from pptx.parts.slide import SlidePart
+    from pptx_patches import bind_partname_allocator, fast_zip
 except ImportError:
     raise ImportError("python-pptx is required. Install with: pip install python-pptx")
 
-try:
-    from PIL import Image
-    HAS_PIL = True
-except ImportError:
-    HAS_PIL = False
+# PIL and the chart modules are imported on first use; text-only decks
+# never pay for them. _PIL is None until the first image, then the
+# PIL.Image module or False when Pillow is not installed.
+_PIL = None
+
+
+def _load_pil():
+    """Return PIL.Image, or None if Pillow is unavailable (cached)."""
+    global _PIL
+    if _PIL is None:
+        try:
+            from PIL import Image
+            _PIL = Image
+        except ImportError:
+            _PIL = False
+    return _PIL or None
 
-# Import from md_parser (same directory)
+# Import from md_parser and themes (same directory)
 from md_parser import SlideData, ContentElement, ContentType
+from themes import ThemeStyle, ThemeConfig, THEMES
+
+
+# Spacing constants as plain int EMUs, computed once
+_GAP_SMALL = int(Inches(0.1))
+_GAP_MEDIUM = int(Inches(0.15))
+_GAP = int(Inches(0.2))
+_PARAGRAPH_HEIGHT = int(Inches(0.5))
+_HEADING_HEIGHT = int(Inches(0.4))
+_LIST_LINE_HEIGHT = int(Inches(0.35))
+_ROW_HEIGHT = int(Inches(0.4))
+_CODE_LINE_HEIGHT = int(Inches(0.25))
+_CODE_PADDING = int(Inches(0.3))
+_CODE_MAX_LINES = 15
+_ZERO = int(Inches(0))
+
+# Placeholder types allowed on the layout used for blank slides
+_TITLE_PLACEHOLDERS = (PP_PLACEHOLDER.TITLE, PP_PLACEHOLDER.CENTER_TITLE)
+
+
+# Text box skeleton matching python-pptx's add_textbox() output, filled in
+# one go so each text element is a single parse + append instead of a
+# chain of proxy setters on the slide tree
+_TEXTBOX_XML = (
+    '<p:sp xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main"'
+    ' xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main">'
+    '<p:nvSpPr><p:cNvPr id="{id}" name="TextBox {name_idx}"/>'
+    '<p:cNvSpPr txBox="1"/><p:nvPr/></p:nvSpPr>'
+    '<p:spPr><a:xfrm><a:off x="{left}" y="{top}"/><a:ext cx="{cx}" cy="{cy}"/></a:xfrm>'
+    '<a:prstGeom prst="rect"><a:avLst/></a:prstGeom><a:noFill/></p:spPr>'
+    '<p:txBody><a:bodyPr wrap="{wrap}"><a:spAutoFit/></a:bodyPr><a:lstStyle/>'
+    '{paragraphs}</p:txBody></p:sp>'
+)
+_SPACE_AFTER_XML = '<a:spcAft><a:spcPts val="600"/></a:spcAft>'  # 6pt
+_PARAGRAPH_XML = '<a:p><a:pPr{attrs}>{spacing}{props}</a:pPr>{runs}</a:p>'
+# Native bullets: hanging indent of 0.375", each level nested 0.5" deeper
+_BULLET_ATTRS = ' marL="{mar_l}" lvl="{level}" indent="-342900"'
+_BULLET_CHAR_XML = '<a:buFont typeface="Arial"/><a:buChar char="\u2022"/>'
+_BULLET_NUM_XML = '<a:buFont typeface="+mj-lt"/><a:buAutoNum type="arabicPeriod"/>'
+_RUN_XML = '<a:r><a:t>{text}</a:t></a:r>'
+_FONT_XML = (
+    '<a:defRPr sz="{sz}"{bold}><a:solidFill><a:srgbClr val="{rgb}"/></a:solidFill>'
+    '{latin}</a:defRPr>'
+)
+_LATIN_XML = '<a:latin typeface="{font}"/>'
+_ALIGN_CENTER = ' algn="ctr"'
+_ALIGN_LEFT = ' algn="l"'
+
+# Slide partnames and ids, allocated from per-deck counters
+_SLIDE_PARTNAME = "/ppt/slides/slide%d.xml"
+_MAX_SLIDE_ID = 2147483648  # sldId ids must be below 2^31
+
+# XML escapes plus python-pptx's _xHHHH_ form for control characters
+_XML_ESCAPES = {ord('&'): '&amp;', ord('<'): '&lt;', ord('>'): '&gt;', ord('"'): '&quot;'}
+_XML_ESCAPES.update(
+    (c, f"_x{c:04X}_") for c in range(0x20) if c not in (0x09, 0x0A, 0x0D)
+)
+
+
+def _escape_xml(text: str) -> str:
+    """Escape text for use in an XML element or attribute."""
+    return text.translate(_XML_ESCAPES)
+
+
+def _paragraph_xml(text: str, font_xml: str, spacing: str = "", attrs: str = "") -> str:
+    """
+    Build one <a:p>; newlines become <a:br/> like _Paragraph.text.
 
+    spacing holds the <a:pPr> children that precede the run properties
+    (spacing and bullet elements), attrs the <a:pPr> attributes.
+    """
+    if text:
+        runs = '<a:br/>'.join(
+            _RUN_XML.format(text=_escape_xml(line)) for line in text.split('\n')
+        )
+    else:
+        runs = ''
+    return _PARAGRAPH_XML.format(attrs=attrs, spacing=spacing, props=font_xml, runs=runs)
+
+
+@lru_cache(maxsize=None)
+def _bullet_ppr(level: int, numbered: bool) -> Tuple[str, str]:
+    """Return (attrs, spacing) for a bullet paragraph at the given level."""
+    # PowerPoint supports list levels 0-8
+    level = min(max(level, 0), 8)
+    attrs = _BULLET_ATTRS.format(mar_l=342900 + level * 457200, level=level)
+    bullet = _BULLET_NUM_XML if numbered else _BULLET_CHAR_XML
+    return attrs, _SPACE_AFTER_XML + bullet
+
+
+def _parse_number(cell) -> float:
+    """Parse a table cell as a chart value ("1,234" -> 1234.0); 0 if not numeric."""
+    try:
+        return float(cell.replace(',', ''))
+    except (ValueError, AttributeError):
+        return 0
+
+
+# Serialized 16:9 blank presentation, built on first use and cloned for
+# every template-less generation instead of re-reading python-pptx's default
+_blank_pptx_bytes: Optional[bytes] = None
+
+
+def _new_blank_presentation():
+    """Return a fresh 16:9 presentation cloned from the in-memory blueprint."""
+    global _blank_pptx_bytes
+    if _blank_pptx_bytes is None:
+        prs = Presentation()
+        prs.slide_width = PPTXGenerator.SLIDE_WIDTH
+        prs.slide_height = PPTXGenerator.SLIDE_HEIGHT
+        buf = io.BytesIO()
+        prs.save(buf)
+        _blank_pptx_bytes = buf.getvalue()
+    return Presentation(io.BytesIO(_blank_pptx_bytes))
 
-class ThemeStyle(Enum):
-    """Available theme styles."""
-    BUSINESS = "business"
-    TECH_DARK = "tech_dark"
-    EDUCATION = "education"
-    NEUMORPHISM = "neumorphism"
-
-
-@dataclass
-class ThemeConfig:
-    """Theme configuration for styling."""
-    name: str
-    background_color: Tuple[int, int, int]
-    title_color: Tuple[int, int, int]
-    text_color: Tuple[int, int, int]
-    accent_color: Tuple[int, int, int]
-    code_bg_color: Tuple[int, int, int]
-    title_font: str
-    body_font: str
-    title_size: int  # in points
-    body_size: int
-    code_size: int
-
-
-# Built-in themes
-THEMES: Dict[str, ThemeConfig] = {
-    "business": ThemeConfig(
-        name="Business",
-        background_color=(255, 255, 255),
-        title_color=(44, 62, 80),
-        text_color=(52, 73, 94),
-        accent_color=(41, 128, 185),
-        code_bg_color=(236, 240, 241),
-        title_font="Arial",
-        body_font="Arial",
-        title_size=36,
-        body_size=18,
-        code_size=14
-    ),
-    "tech_dark": ThemeConfig(
-        name="Tech Dark",
-        background_color=(30, 30, 30),
-        title_color=(255, 255, 255),
-        text_color=(220, 220, 220),
-        accent_color=(0, 200, 150),
-        code_bg_color=(45, 45, 45),
-        title_font="Consolas",
-        body_font="Segoe UI",
-        title_size=36,
-        body_size=18,
-        code_size=14
-    ),
-    "education": ThemeConfig(
-        name="Education",
-        background_color=(255, 250, 240),
-        title_color=(70, 130, 180),
-        text_color=(60, 60, 60),
-        accent_color=(255, 140, 0),
-        code_bg_color=(245, 245, 245),
-        title_font="Georgia",
-        body_font="Verdana",
-        title_size=36,
-        body_size=18,
-        code_size=14
-    ),
-    "neumorphism": ThemeConfig(
-        name="Neumorphism",
-        background_color=(240, 243, 249),
-        title_color=(45, 55, 72),
-        text_color=(74, 85, 104),
-        accent_color=(66, 153, 225),
-        code_bg_color=(226, 232, 240),
-        title_font="Arial",
-        body_font="Arial",
-        title_size=36,
-        body_size=18,
-        code_size=14
-    )
-}
+
+@lru_cache(maxsize=8)
+def _read_template_bytes(path: str, mtime: float, size: int) -> bytes:
+    """Read a template file; mtime and size key the cache so edits are seen."""
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def _open_template(path: str):
+    """Return a fresh presentation opened from a (cached) template file."""
+    st = os.stat(path)
+    return Presentation(io.BytesIO(_read_template_bytes(path, st.st_mtime, st.st_size)))
 
 
 class PPTXGenerator:
@@ -126,6 +187,25 @@ class PPTXGenerator:
     MARGIN_TOP = Inches(1.2)
     MARGIN_BOTTOM = Inches(0.5)
 
+    # Derived content geometry as plain int EMUs, computed once from the
+    # values above
+    CONTENT_TOP = int(MARGIN_TOP)
+    CONTENT_WIDTH = int(SLIDE_WIDTH - MARGIN_LEFT - MARGIN_RIGHT)
+    CONTENT_BOTTOM = int(SLIDE_HEIGHT - MARGIN_BOTTOM)
+    COLUMN_GAP = int(Inches(0.5))
+    COLUMN_WIDTH = (CONTENT_WIDTH - COLUMN_GAP) // 2
+    RIGHT_COLUMN_LEFT = int(MARGIN_LEFT) + COLUMN_WIDTH + COLUMN_GAP
+
+    # Image and chart slide regions
+    IMAGE_LEFT = int(Inches(2))
+    IMAGE_WIDTH = int(SLIDE_WIDTH - Inches(4))
+    IMAGE_EXTRA_TOP = int(Inches(5.5))
+    IMAGE_MAX_HEIGHT = int(Inches(4))
+    CHART_LEFT = int(Inches(1))
+    CHART_WIDTH = int(SLIDE_WIDTH - Inches(2))
+    CHART_HEIGHT = int(Inches(5))
+    FOCUS_TOP = int(Inches(1.5))
+
     def __init__(self, theme: str = "business", template_path: Optional[str] = None):
         """
         Initialize generator with theme or template.
@@ -136,6 +216,44 @@ class PPTXGenerator:
         """
         self.template_path = template_path
         self.theme = THEMES.get(theme, THEMES["business"])
+        # Colors and font sizes reused by every element on every slide
+        t = self.theme
+        self._rgb = {
+            'text': RGBColor(*t.text_color),
+            'accent': RGBColor(*t.accent_color),
+            'code_bg': RGBColor(*t.code_bg_color),
+            'background': RGBColor(*t.background_color),
+            'white': RGBColor(255, 255, 255),
+        }
+        self._pt = {
+            'tbl': Pt(t.body_size - 2),
+        }
+        # Element type -> method that places it on a slide
+        self._element_handlers = {
+            ContentType.PARAGRAPH: self._add_paragraph_element,
+            ContentType.HEADING: self._add_heading_element,
+            ContentType.BULLET_LIST: self._add_list_element,
+            ContentType.NUMBERED_LIST: self._add_list_element,
+            ContentType.CODE_BLOCK: self._add_code_element,
+            ContentType.TABLE: self._add_table_element,
+            ContentType.IMAGE: self._add_image_element,
+        }
+        # Image sizes and bytes keyed by (path, mtime, size), so an image
+        # reused across slides is decoded and read from disk only once
+        self._img_dim_cache: Dict[Tuple[str, float, int], Tuple[int, int]] = {}
+        self._img_bytes_cache: Dict[Tuple[str, float, int], bytes] = {}
+        # SHA-256 -> bytes, so identical files under different paths share
+        # one buffer (python-pptx then stores a single media part for them)
+        self._img_sha: Dict[str, bytes] = {}
+        # Paragraph run properties for the XML-built text boxes
+        self._font_xml = {
+            'body': self._make_font_xml(t.body_size, t.text_color, t.body_font),
+            'code': self._make_font_xml(t.code_size, t.text_color, "Consolas"),
+            'title': self._make_font_xml(t.title_size, t.title_color, t.title_font, bold=True),
+            'cover_title': self._make_font_xml(44, t.title_color, t.title_font, bold=True),
+            'cover_subtitle': self._make_font_xml(24, t.text_color, t.body_font),
+            'err': self._make_font_xml(12, (200, 100, 100)),
+        }
         self.prs: Optional[Presentation] = None
         self.warnings: List[str] = []
         self.progress_callback = None
@@ -150,13 +268,17 @@ class PPTXGenerator:
         if self.progress_callback:
             self.progress_callback(current, total, message)
 
-    def generate(self, slides: List[SlideData], output_path: str) -> bool:
+    def generate(self, slides: List[SlideData], output_path: str,
+                 release_slides: bool = False) -> bool:
         """
         Generate PPTX from slide data.
 
         Args:
             slides: List of SlideData objects
             output_path: Output file path
+            release_slides: Clear each SlideData's content once its slide is
+                built so parsed elements can be freed before the save. Only
+                pass True when the caller does not reuse the slide data.
 
         Returns:
             True if successful
@@ -165,11 +287,14 @@ class PPTXGenerator:
 
         # Create presentation
         if self.template_path and os.path.exists(self.template_path):
-            self.prs = Presentation(self.template_path)
+            self.prs = _open_template(self.template_path)
         else:
-            self.prs = Presentation()
-            self.prs.slide_width = self.SLIDE_WIDTH
-            self.prs.slide_height = self.SLIDE_HEIGHT
+            self.prs = _new_blank_presentation()
+        # Charts and other parts would otherwise rescan every part per name
+        bind_partname_allocator(self.prs.part.package)
+        self._blank_layout = self._find_blank_layout()
+        self._apply_theme_background()
+        self._init_slide_numbering()
 
         total_slides = len(slides)
 
@@ -192,66 +317,155 @@ class PPTXGenerator:
                 # Create fallback slide
                 self._create_fallback_slide(slide_data, str(e))
 
+            if release_slides:
+                slide_data.elements.clear()
+                slide_data.subtitle = ""
+
         # Save presentation
         try:
-            self.prs.save(output_path)
+            # Deflate at ZIP_COMPRESSLEVEL: much faster than zlib's
+            # default for slide XML, at a few percent larger output
+            with fast_zip():
+                self.prs.save(output_path)
             self._report_progress(total_slides, total_slides, f"Saved to {output_path}")
             return True
         except Exception as e:
             self.warnings.append(f"Failed to save: {str(e)}")
             return False
 
-    def _add_blank_slide(self) -> Any:
-        """Add a blank slide to the presentation."""
-        # Try to find a blank layout, fallback to last available layout
+    @staticmethod
+    def _make_font_xml(size, color, font=None, bold=False) -> str:
+        """Build the <a:defRPr> for a paragraph (size in points)."""
+        return _FONT_XML.format(
+            sz=int(size * 100),
+            bold=' b="1"' if bold else '',
+            rgb='%02X%02X%02X' % tuple(color),
+            latin=_LATIN_XML.format(font=_escape_xml(font)) if font else '',
+        )
+
+    def _styled_textbox(self, slide, left, top, width, height, text: str,
+                        font_xml: str, align: str = "", word_wrap: bool = False):
+        """Add a single-paragraph text box with its formatting inline."""
+        return self._append_textbox(
+            slide, left, top, width, height,
+            _paragraph_xml(text, font_xml, attrs=align),
+            word_wrap=word_wrap
+        )
+
+    def _append_textbox(self, slide, left, top, width, height,
+                        paragraphs_xml: str, word_wrap: bool = False):
+        """Append a text box built from _TEXTBOX_XML to the slide."""
+        shapes = slide.shapes
+        shape_id = shapes._next_shape_id
+        sp = parse_xml(_TEXTBOX_XML.format(
+            id=shape_id,
+            name_idx=shape_id - 1,
+            left=int(left), top=int(top), cx=int(width), cy=int(height),
+            wrap='square' if word_wrap else 'none',
+            paragraphs=paragraphs_xml,
+        ))
+        shapes._spTree.append(sp)
+        return sp
+
+    def _find_blank_layout(self) -> Any:
+        """
+        Pick the layout used for every generated slide.
+
+        Prefers a layout with at most a title placeholder among the common
+        blank indices, falling back to the first index that exists.
+        """
         layouts = self.prs.slide_layouts
         num_layouts = len(layouts)
 
         # Common blank layout indices to try
-        blank_indices = [6, 5, num_layouts - 1, 0]
+        candidates = [idx for idx in (6, 5, num_layouts - 1, 0) if 0 <= idx < num_layouts]
+
+        for idx in candidates:
+            placeholders = layouts[idx].placeholders
+            if all(ph.placeholder_format.type in _TITLE_PLACEHOLDERS for ph in placeholders):
+                return layouts[idx]
+
+        return layouts[candidates[0]]
+
+    def _init_slide_numbering(self):
+        """Seed the slide partname and sldId counters once per deck."""
+        # Presentation.slides renames template slide parts to slide1..N on
+        # first access, so read it before collecting the used partnames
+        self._sld_id_lst = self.prs.slides._sldIdLst
+        self._next_slide_id = self._sld_id_lst._next_id
+        self._used_partnames = {str(part.partname) for part in self.prs.part.package.iter_parts()}
+        self._next_slide_number = 1
+
+    def _next_slide_partname(self) -> Any:
+        """Return the next unused /ppt/slides/slideN.xml partname."""
+        n = self._next_slide_number
+        while _SLIDE_PARTNAME % n in self._used_partnames:
+            n += 1
+        self._next_slide_number = n + 1
+        return PackURI(_SLIDE_PARTNAME % n)
+
+    def _add_blank_slide(self) -> Any:
+        """
+        Add a blank slide to the presentation.
+
+        Mirrors Slides.add_slide(), but the partname and the <p:sldId> id
+        come from counters seeded by _init_slide_numbering() instead of
+        rescanning the slide list for every slide.
+        """
+        prs_part = self.prs.part
+        slide_part = SlidePart.new(
+            self._next_slide_partname(), prs_part.package, self._blank_layout.part
+        )
+        rId = prs_part.relate_to(slide_part, RT.SLIDE)
+        if self._next_slide_id < _MAX_SLIDE_ID:
+            self._sld_id_lst._add_sldId(id=self._next_slide_id, rId=rId)
+            self._next_slide_id += 1
+        else:
+            # Id space exhausted at the top; let python-pptx fill gaps
+            self._sld_id_lst.add_sldId(rId)
 
-        for idx in blank_indices:
-            if idx < num_layouts:
-                try:
-                    return self.prs.slides.add_slide(layouts[idx])
-                except Exception:
-                    continue
+        slide = slide_part.slide
+        slide.shapes.clone_layout_placeholders(self._blank_layout)
+        return slide
 
-        # Last resort: use first available layout
-        return self.prs.slides.add_slide(layouts[0])
+    def _apply_theme_background(self):
+        """
+        Set the theme background once on the layout every slide uses.
 
-    def _set_background(self, slide):
-        """Set slide background color based on theme (skip if using template)."""
+        Slides inherit it, so no per-slide <p:bg> is written. If the layout
+        background cannot be changed, _set_background falls back to
+        setting it on each slide.
+        """
+        self._per_slide_background = False
         if self._use_template_background:
             # Don't override template background
             return
+        try:
+            fill = self._blank_layout.background.fill
+            fill.solid()
+            fill.fore_color.rgb = self._rgb['background']
+        except Exception:
+            self._per_slide_background = True
+
+    def _set_background(self, slide):
+        """Set slide background color when the layout could not carry it."""
+        if not self._per_slide_background:
+            return
         try:
             background = slide.background
             fill = background.fill
             fill.solid()
-            fill.fore_color.rgb = RGBColor(*self.theme.background_color)
+            fill.fore_color.rgb = self._rgb['background']
         except Exception:
             # Some templates may not support background modification
             pass
 
     def _add_title_shape(self, slide, title: str, top: float = 0.3, height: float = 0.8) -> Any:
         """Add title text box to slide."""
-        left = self.MARGIN_LEFT
-        width = self.SLIDE_WIDTH - self.MARGIN_LEFT - self.MARGIN_RIGHT
-
-        shape = slide.shapes.add_textbox(left, Inches(top), width, Inches(height))
-        tf = shape.text_frame
-        tf.word_wrap = True
-
-        p = tf.paragraphs[0]
-        p.text = title
-        p.font.size = Pt(self.theme.title_size)
-        p.font.bold = True
-        p.font.color.rgb = RGBColor(*self.theme.title_color)
-        p.font.name = self.theme.title_font
-        p.alignment = PP_ALIGN.LEFT
-
-        return shape
+        return self._styled_textbox(
+            slide, self.MARGIN_LEFT, Inches(top), self.CONTENT_WIDTH, Inches(height),
+            title, self._font_xml['title'], align=_ALIGN_LEFT, word_wrap=True
+        )
 
     def _create_title_slide(self, slide_data: SlideData):
         """Create a title slide."""
@@ -260,38 +474,18 @@ class PPTXGenerator:
 
         # Center title
         title_top = 2.5
-        title_shape = slide.shapes.add_textbox(
-            self.MARGIN_LEFT,
-            Inches(title_top),
-            self.SLIDE_WIDTH - self.MARGIN_LEFT - self.MARGIN_RIGHT,
-            Inches(1.5)
+        self._styled_textbox(
+            slide, self.MARGIN_LEFT, Inches(title_top), self.CONTENT_WIDTH, Inches(1.5),
+            slide_data.title, self._font_xml['cover_title'],
+            align=_ALIGN_CENTER, word_wrap=True
         )
-        tf = title_shape.text_frame
-        tf.word_wrap = True
-
-        p = tf.paragraphs[0]
-        p.text = slide_data.title
-        p.font.size = Pt(44)
-        p.font.bold = True
-        p.font.color.rgb = RGBColor(*self.theme.title_color)
-        p.font.name = self.theme.title_font
-        p.alignment = PP_ALIGN.CENTER
 
         # Subtitle
         if slide_data.subtitle:
-            subtitle_shape = slide.shapes.add_textbox(
-                self.MARGIN_LEFT,
-                Inches(title_top + 1.5),
-                self.SLIDE_WIDTH - self.MARGIN_LEFT - self.MARGIN_RIGHT,
-                Inches(1)
+            self._styled_textbox(
+                slide, self.MARGIN_LEFT, Inches(title_top + 1.5), self.CONTENT_WIDTH, Inches(1),
+                slide_data.subtitle, self._font_xml['cover_subtitle'], align=_ALIGN_CENTER
             )
-            tf = subtitle_shape.text_frame
-            p = tf.paragraphs[0]
-            p.text = slide_data.subtitle
-            p.font.size = Pt(24)
-            p.font.color.rgb = RGBColor(*self.theme.text_color)
-            p.font.name = self.theme.body_font
-            p.alignment = PP_ALIGN.CENTER
 
     def _create_content_slide(self, slide_data: SlideData):
         """Create a standard content slide."""
@@ -301,23 +495,22 @@ class PPTXGenerator:
         # Add title
         self._add_title_shape(slide, slide_data.title)
 
-        # Content area
-        content_top = self.MARGIN_TOP
-        content_left = self.MARGIN_LEFT
-        content_width = self.SLIDE_WIDTH - self.MARGIN_LEFT - self.MARGIN_RIGHT
-        available_height = self.SLIDE_HEIGHT - self.MARGIN_TOP - self.MARGIN_BOTTOM
+        # Content area; positions are plain int EMUs throughout the loop
+        content_left = int(self.MARGIN_LEFT)
+        content_width = self.CONTENT_WIDTH
+        content_bottom = self.CONTENT_BOTTOM
 
-        current_top = content_top
+        current_top = self.CONTENT_TOP
 
         for element in slide_data.elements:
-            if current_top > self.SLIDE_HEIGHT - self.MARGIN_BOTTOM:
+            if current_top > content_bottom:
                 self.warnings.append(f"Content overflow on slide: {slide_data.title}")
                 break
 
             element_height = self._add_element(
                 slide, element, content_left, current_top, content_width
             )
-            current_top += element_height + Inches(0.2)
+            current_top += element_height + _GAP
 
     def _create_image_slide(self, slide_data: SlideData):
         """Create a slide with image focus."""
@@ -331,7 +524,7 @@ class PPTXGenerator:
         image_elem = None
         other_elements = []
         for elem in slide_data.elements:
-            if elem.type == ContentType.IMAGE and image_elem is None:
+            if elem.type is ContentType.IMAGE and image_elem is None:
                 image_elem = elem
             else:
                 other_elements.append(elem)
@@ -340,19 +533,19 @@ class PPTXGenerator:
             # Add image centered
             self._add_image_element(
                 slide, image_elem,
-                Inches(2), Inches(1.5),
-                self.SLIDE_WIDTH - Inches(4)
+                self.IMAGE_LEFT, self.FOCUS_TOP,
+                self.IMAGE_WIDTH
             )
 
         # Add other elements below
-        current_top = Inches(5.5)
+        current_top = self.IMAGE_EXTRA_TOP
         for elem in other_elements[:2]:  # Limit to 2 extra elements
             height = self._add_element(
                 slide, elem,
                 self.MARGIN_LEFT, current_top,
-                self.SLIDE_WIDTH - self.MARGIN_LEFT - self.MARGIN_RIGHT
+                self.CONTENT_WIDTH
             )
-            current_top += height + Inches(0.1)
+            current_top += height + _GAP_SMALL
 
     def _create_chart_slide(self, slide_data: SlideData):
         """Create a slide with chart focus."""
@@ -370,20 +563,20 @@ class PPTXGenerator:
                 break
 
         if chart_elem:
-            if chart_elem.type == ContentType.TABLE:
+            if chart_elem.type is ContentType.TABLE:
                 # Convert table to chart
                 self._add_chart_from_table(
                     slide, chart_elem,
-                    Inches(1), Inches(1.5),
-                    self.SLIDE_WIDTH - Inches(2),
-                    Inches(5)
+                    self.CHART_LEFT, self.FOCUS_TOP,
+                    self.CHART_WIDTH,
+                    self.CHART_HEIGHT
                 )
             else:
                 self._add_chart_element(
                     slide, chart_elem,
-                    Inches(1), Inches(1.5),
-                    self.SLIDE_WIDTH - Inches(2),
-                    Inches(5)
+                    self.CHART_LEFT, self.FOCUS_TOP,
+                    self.CHART_WIDTH,
+                    self.CHART_HEIGHT
                 )
 
     def _create_two_column_slide(self, slide_data: SlideData):
@@ -401,20 +594,20 @@ class PPTXGenerator:
         left_elements = elements[:mid]
         right_elements = elements[mid:]
 
-        col_width = (self.SLIDE_WIDTH - self.MARGIN_LEFT - self.MARGIN_RIGHT - Inches(0.5)) / 2
+        col_width = self.COLUMN_WIDTH
 
         # Left column
-        current_top = self.MARGIN_TOP
+        current_top = self.CONTENT_TOP
         for elem in left_elements:
             height = self._add_element(slide, elem, self.MARGIN_LEFT, current_top, col_width)
-            current_top += height + Inches(0.15)
+            current_top += height + _GAP_MEDIUM
 
         # Right column
-        current_top = self.MARGIN_TOP
-        right_left = self.MARGIN_LEFT + col_width + Inches(0.5)
+        current_top = self.CONTENT_TOP
+        right_left = self.RIGHT_COLUMN_LEFT
         for elem in right_elements:
             height = self._add_element(slide, elem, right_left, current_top, col_width)
-            current_top += height + Inches(0.15)
+            current_top += height + _GAP_MEDIUM
 
     def _create_fallback_slide(self, slide_data: SlideData, error: str):
         """Create a simple fallback slide when normal creation fails."""
@@ -425,17 +618,10 @@ class PPTXGenerator:
         self._add_title_shape(slide, slide_data.title)
 
         # Add error note
-        shape = slide.shapes.add_textbox(
-            self.MARGIN_LEFT,
-            self.MARGIN_TOP,
-            self.SLIDE_WIDTH - self.MARGIN_LEFT - self.MARGIN_RIGHT,
-            Inches(1)
+        self._styled_textbox(
+            slide, self.MARGIN_LEFT, self.MARGIN_TOP, self.CONTENT_WIDTH, Inches(1),
+            f"[Content generation error: {error}]", self._font_xml['err']
         )
-        tf = shape.text_frame
-        p = tf.paragraphs[0]
-        p.text = f"[Content generation error: {error}]"
-        p.font.size = Pt(12)
-        p.font.color.rgb = RGBColor(200, 100, 100)
 
     def _add_element(self, slide, element: ContentElement, left, top, width) -> float:
         """
@@ -444,92 +630,71 @@ class PPTXGenerator:
         Returns:
             Height of the added element in EMUs
         """
-        if element.type == ContentType.PARAGRAPH:
-            return self._add_paragraph_element(slide, element, left, top, width)
-        elif element.type == ContentType.HEADING:
-            return self._add_heading_element(slide, element, left, top, width)
-        elif element.type in (ContentType.BULLET_LIST, ContentType.NUMBERED_LIST):
-            return self._add_list_element(slide, element, left, top, width)
-        elif element.type == ContentType.CODE_BLOCK:
-            return self._add_code_element(slide, element, left, top, width)
-        elif element.type == ContentType.TABLE:
-            return self._add_table_element(slide, element, left, top, width)
-        elif element.type == ContentType.IMAGE:
-            return self._add_image_element(slide, element, left, top, width)
-        else:
-            return Inches(0)
+        handler = self._element_handlers.get(element.type)
+        if handler is None:
+            return _ZERO
+        return handler(slide, element, left, top, width)
 
     def _add_paragraph_element(self, slide, element: ContentElement, left, top, width) -> float:
         """Add paragraph text."""
-        height = Inches(0.5)
-        shape = slide.shapes.add_textbox(left, top, width, height)
-        tf = shape.text_frame
-        tf.word_wrap = True
-
-        p = tf.paragraphs[0]
-        p.text = element.content
-        p.font.size = Pt(self.theme.body_size)
-        p.font.color.rgb = RGBColor(*self.theme.text_color)
-        p.font.name = self.theme.body_font
+        height = _PARAGRAPH_HEIGHT
+        self._styled_textbox(
+            slide, left, top, width, height,
+            element.content, self._font_xml['body'], word_wrap=True
+        )
 
         return height
 
     def _add_heading_element(self, slide, element: ContentElement, left, top, width) -> float:
         """Add sub-heading text."""
-        level = element.metadata.get("level", 3)
+        level = (element.metadata or {}).get("level", 3)
         size = max(14, self.theme.body_size + (6 - level) * 2)
 
-        height = Inches(0.4)
-        shape = slide.shapes.add_textbox(left, top, width, height)
-        tf = shape.text_frame
-
-        p = tf.paragraphs[0]
-        p.text = element.content
-        p.font.size = Pt(size)
-        p.font.bold = True
-        p.font.color.rgb = RGBColor(*self.theme.title_color)
-        p.font.name = self.theme.title_font
+        height = _HEADING_HEIGHT
+        font_xml = self._make_font_xml(
+            size, self.theme.title_color, self.theme.title_font, bold=True
+        )
+        self._styled_textbox(slide, left, top, width, height, element.content, font_xml)
 
         return height
 
     def _add_list_element(self, slide, element: ContentElement, left, top, width) -> float:
         """Add bullet or numbered list."""
         items = element.content
-        is_numbered = element.type == ContentType.NUMBERED_LIST
+        is_numbered = element.type is ContentType.NUMBERED_LIST
 
-        line_height = Inches(0.35)
-        height = line_height * len(items)
+        height = _LIST_LINE_HEIGHT * len(items)
 
-        shape = slide.shapes.add_textbox(left, top, width, height)
-        tf = shape.text_frame
-        tf.word_wrap = True
+        font_xml = self._font_xml['body']
+        paragraphs = []
+        for item in items:
+            # Indentation and bullets/numbers are rendered by PowerPoint
+            attrs, spacing = _bullet_ppr(item.get("indent", 0), is_numbered)
+            paragraphs.append(_paragraph_xml(item['text'], font_xml, spacing, attrs))
 
-        for i, item in enumerate(items):
-            if i == 0:
-                p = tf.paragraphs[0]
-            else:
-                p = tf.add_paragraph()
-
-            indent = item.get("indent", 0)
-            prefix = f"{i + 1}. " if is_numbered else "• "
-            indent_str = "    " * indent
-
-            p.text = f"{indent_str}{prefix}{item['text']}"
-            p.font.size = Pt(self.theme.body_size)
-            p.font.color.rgb = RGBColor(*self.theme.text_color)
-            p.font.name = self.theme.body_font
-            p.space_after = Pt(6)
+        self._append_textbox(
+            slide, left, top, width, height, ''.join(paragraphs), word_wrap=True
+        )
 
         return height
 
     def _add_code_element(self, slide, element: ContentElement, left, top, width) -> float:
         """Add code block with simple styling."""
         code = element.content
-        lines = code.split('\n')
-        line_count = min(len(lines), 15)  # Limit lines
+        total_lines = code.count('\n') + 1
+        line_count = min(total_lines, _CODE_MAX_LINES)  # Limit lines
+
+        # Slice the shown lines off the raw string instead of splitting
+        # the whole block, so a huge paste is never turned into a list
+        if total_lines > line_count:
+            end = -1
+            for _ in range(line_count):
+                end = code.find('\n', end + 1)
+            display_code = f"{code[:end]}\n... ({total_lines - line_count} more lines)"
+        else:
+            display_code = code
 
-        line_height = Inches(0.25)
-        height = line_height * line_count + Inches(0.3)
+        height = _CODE_LINE_HEIGHT * line_count + _CODE_PADDING
 
         # Background shape
         bg_shape = slide.shapes.add_shape(
@@ -537,28 +702,18 @@ class PPTXGenerator:
             left, top, width, height
         )
         bg_shape.fill.solid()
-        bg_shape.fill.fore_color.rgb = RGBColor(*self.theme.code_bg_color)
+        bg_shape.fill.fore_color.rgb = self._rgb['code_bg']
         bg_shape.line.fill.background()
 
         # Code text
-        text_shape = slide.shapes.add_textbox(
-            left + Inches(0.1),
-            top + Inches(0.1),
-            width - Inches(0.2),
-            height - Inches(0.2)
+        self._append_textbox(
+            slide,
+            left + _GAP_SMALL,
+            top + _GAP_SMALL,
+            width - _GAP,
+            height - _GAP,
+            _paragraph_xml(display_code, self._font_xml['code'])
         )
-        tf = text_shape.text_frame
-        tf.word_wrap = False
-
-        display_code = '\n'.join(lines[:line_count])
-        if len(lines) > line_count:
-            display_code += f"\n... ({len(lines) - line_count} more lines)"
-
-        p = tf.paragraphs[0]
-        p.text = display_code
-        p.font.size = Pt(self.theme.code_size)
-        p.font.name = "Consolas"
-        p.font.color.rgb = RGBColor(*self.theme.text_color)
 
         return height
 
@@ -569,41 +724,42 @@ class PPTXGenerator:
         rows = data.get("rows", [])
 
         if not headers and not rows:
-            return Inches(0)
+            return _ZERO
 
         col_count = len(headers) if headers else len(rows[0]) if rows else 0
         row_count = len(rows) + (1 if headers else 0)
 
         if col_count == 0 or row_count == 0:
-            return Inches(0)
+            return _ZERO
 
-        row_height = Inches(0.4)
-        height = row_height * row_count
+        height = _ROW_HEIGHT * row_count
 
         table = slide.shapes.add_table(
             row_count, col_count,
             left, top, width, height
         ).table
 
+        # Materialize the cell proxies once instead of per cell access
+        row_cells = [list(row.cells) for row in table.rows]
+
         # Style table
-        for i, cell in enumerate(table.rows[0].cells if headers else []):
+        for i, cell in enumerate(row_cells[0] if headers else []):
             cell.text = headers[i] if i < len(headers) else ""
             cell.fill.solid()
-            cell.fill.fore_color.rgb = RGBColor(*self.theme.accent_color)
+            cell.fill.fore_color.rgb = self._rgb['accent']
             p = cell.text_frame.paragraphs[0]
             p.font.bold = True
-            p.font.size = Pt(self.theme.body_size - 2)
-            p.font.color.rgb = RGBColor(255, 255, 255)
+            p.font.size = self._pt['tbl']
+            p.font.color.rgb = self._rgb['white']
 
         start_row = 1 if headers else 0
-        for row_idx, row_data in enumerate(rows):
-            for col_idx, cell_text in enumerate(row_data):
-                if col_idx < col_count:
-                    cell = table.rows[start_row + row_idx].cells[col_idx]
-                    cell.text = str(cell_text)
-                    p = cell.text_frame.paragraphs[0]
-                    p.font.size = Pt(self.theme.body_size - 2)
-                    p.font.color.rgb = RGBColor(*self.theme.text_color)
+        for row_data, cells in zip(rows, row_cells[start_row:]):
+            # zip() stops at col_count, dropping cells beyond the header width
+            for cell, cell_text in zip(cells, row_data):
+                cell.text = str(cell_text)
+                p = cell.text_frame.paragraphs[0]
+                p.font.size = self._pt['tbl']
+                p.font.color.rgb = self._rgb['text']
 
         return height
 
@@ -611,39 +767,53 @@ class PPTXGenerator:
         """Add image from local file."""
         img_path = element.content
 
-        if not os.path.exists(img_path):
+        try:
+            st = os.stat(img_path)
+        except OSError:
             self.warnings.append(f"Image not found: {img_path}")
-            return Inches(0)
+            return _ZERO
+        key = (img_path, st.st_mtime, st.st_size)
 
         try:
             # Get image dimensions
-            max_height = Inches(4)
-
-            if HAS_PIL:
-                with Image.open(img_path) as img:
-                    img_width, img_height = img.size
-                    aspect = img_width / img_height
-
-                    # Calculate dimensions to fit
-                    if width / aspect > max_height:
-                        height = max_height
-                        actual_width = height * aspect
-                    else:
-                        actual_width = width
-                        height = width / aspect
+            max_height = self.IMAGE_MAX_HEIGHT
+
+            Image = _load_pil()
+            if Image is not None:
+                size = self._img_dim_cache.get(key)
+                if size is None:
+                    with Image.open(img_path) as img:
+                        size = self._img_dim_cache[key] = img.size
+                img_width, img_height = size
+                aspect = img_width / img_height
+
+                # Calculate dimensions to fit
+                if width / aspect > max_height:
+                    height = max_height
+                    actual_width = int(height * aspect)
+                else:
+                    actual_width = width
+                    height = int(width / aspect)
             else:
                 actual_width = width
                 height = max_height
 
             # Center image
-            center_left = left + (width - actual_width) / 2
+            center_left = left + (width - actual_width) // 2
 
-            slide.shapes.add_picture(img_path, center_left, top, actual_width, height)
+            blob = self._img_bytes_cache.get(key)
+            if blob is None:
+                with open(img_path, 'rb') as f:
+                    data = f.read()
+                blob = self._img_sha.setdefault(hashlib.sha256(data).hexdigest(), data)
+                self._img_bytes_cache[key] = blob
+
+            slide.shapes.add_picture(io.BytesIO(blob), center_left, top, actual_width, height)
             return height
 
         except Exception as e:
             self.warnings.append(f"Failed to add image {img_path}: {str(e)}")
-            return Inches(0)
+            return _ZERO
 
     def _add_chart_from_table(self, slide, element: ContentElement, left, top, width, height):
         """Create a chart from table data."""
@@ -657,21 +827,21 @@ class PPTXGenerator:
             return
 
         try:
+            from pptx.chart.data import CategoryChartData
+            from pptx.enum.chart import XL_CHART_TYPE
+
             chart_data = CategoryChartData()
             chart_data.categories = [row[0] for row in rows]
 
-            # Add series for each numeric column
-            for col_idx in range(1, len(headers)):
-                values = []
-                for row in rows:
-                    if col_idx < len(row):
-                        try:
-                            values.append(float(row[col_idx].replace(',', '')))
-                        except (ValueError, AttributeError):
-                            values.append(0)
-                    else:
-                        values.append(0)
-                chart_data.add_series(headers[col_idx], values)
+            # Parse every data cell in one row-major pass (short rows are
+            # padded with 0), then add one series per column
+            col_count = len(headers)
+            parsed = [
+                [_parse_number(cell) for cell in row[1:col_count]] + [0] * (col_count - len(row))
+                for row in rows
+            ]
+            for header, values in zip(headers[1:], zip(*parsed)):
+                chart_data.add_series(header, list(values))
 
             chart = slide.shapes.add_chart(
                 XL_CHART_TYPE.COLUMN_CLUSTERED,
@@ -701,7 +871,8 @@ def generate_pptx(
     output_path: str,
     theme: str = "business",
     template_path: Optional[str] = None,
-    progress_callback=None
+    progress_callback=None,
+    release_slides: bool = False
 ) -> Tuple[bool, List[str]]:
     """
     Convenience function to generate PPTX.
@@ -712,6 +883,7 @@ def generate_pptx(
         theme: Theme name
         template_path: Optional custom template path
         progress_callback: Optional callback(current, total, message)
+        release_slides: Free each slide's parsed content once it is built
 
     Returns:
         Tuple of (success, warnings)
@@ -720,7 +892,7 @@ def generate_pptx(
     if progress_callback:
         generator.set_progress_callback(progress_callback)
 
-    success = generator.generate(slides, output_path)
+    success = generator.generate(slides, output_path, release_slides=release_slides)
     return success, generator.get_warnings()
 
 
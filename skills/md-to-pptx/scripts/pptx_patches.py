@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+python-pptx Speedups for md-to-pptx
+
+Small patches shared by the generator and the template builder. Importing
+this module requires python-pptx; callers handle the ImportError.
+"""
+
+import zipfile
+from contextlib import contextmanager
+
+from pptx.opc.packuri import PackURI
+
+
+def bind_partname_allocator(package):
+    """
+    Give one package an O(1)-per-call next_partname.
+
+    The stock method walks every part in the package on each call, which
+    is quadratic when many charts are added to one presentation. The first
+    call per template snapshots the partnames already in use; each call then
+    returns the lowest number not yet in that snapshot or handed out.
+    Only this package instance is affected.
+    """
+    state = {}
+
+    def next_partname(tmpl):
+        entry = state.get(tmpl)
+        if entry is None:
+            used = {str(part.partname) for part in package.iter_parts()}
+            entry = state[tmpl] = [used, 1]
+        used, n = entry
+        while tmpl % n in used:
+            n += 1
+        entry[1] = n + 1
+        return PackURI(tmpl % n)
+
+    package.next_partname = next_partname
+
+
+# Deflate level used when saving presentations (zlib default is 6)
+ZIP_COMPRESSLEVEL = 1
+
+
+class _FastZipFile(zipfile.ZipFile):
+    """ZipFile that defaults deflated writers to ZIP_COMPRESSLEVEL."""
+
+    def __init__(self, file, mode="r", compression=zipfile.ZIP_STORED,
+                 allowZip64=True, compresslevel=None, **kwargs):
+        if mode == "w" and compression == zipfile.ZIP_DEFLATED and compresslevel is None:
+            compresslevel = ZIP_COMPRESSLEVEL
+        super().__init__(file, mode, compression, allowZip64, compresslevel, **kwargs)
+
+
+@contextmanager
+def fast_zip():
+    """Temporarily make python-pptx write archives with _FastZipFile."""
+    # python-pptx 1.x calls zipfile.ZipFile, 0.6.x binds ZipFile in phys_pkg
+    targets = [zipfile]
+    try:
+        from pptx.opc import phys_pkg
+        targets.append(phys_pkg)
+    except ImportError:
+        pass
+
+    saved = [(mod, mod.ZipFile) for mod in targets if hasattr(mod, "ZipFile")]
+    for mod, _ in saved:
+        mod.ZipFile = _FastZipFile
+    try:
+        yield
+    finally:
+        for mod, original in saved:
+            mod.ZipFile = original
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Theme Definitions for md-to-pptx
+
+Theme colors, fonts and sizes. Kept free of python-pptx imports so the
+CLI can list and validate themes without loading the generator.
+"""
+
+from typing import Dict, Tuple
+from dataclasses import dataclass
+from enum import Enum
+
+
+class ThemeStyle(Enum):
+    """Available theme styles."""
+    BUSINESS = "business"
+    TECH_DARK = "tech_dark"
+    EDUCATION = "education"
+    NEUMORPHISM = "neumorphism"
+
+
+@dataclass
+class ThemeConfig:
+    """Theme configuration for styling."""
+    name: str
+    background_color: Tuple[int, int, int]
+    title_color: Tuple[int, int, int]
+    text_color: Tuple[int, int, int]
+    accent_color: Tuple[int, int, int]
+    code_bg_color: Tuple[int, int, int]
+    title_font: str
+    body_font: str
+    title_size: int  # in points
+    body_size: int
+    code_size: int
+
+
+# Built-in themes
+THEMES: Dict[str, ThemeConfig] = {
+    "business": ThemeConfig(
+        name="Business",
+        background_color=(255, 255, 255),
+        title_color=(44, 62, 80),
+        text_color=(52, 73, 94),
+        accent_color=(41, 128, 185),
+        code_bg_color=(236, 240, 241),
+        title_font="Arial",
+        body_font="Arial",
+        title_size=36,
+        body_size=18,
+        code_size=14
+    ),
+    "tech_dark": ThemeConfig(
+        name="Tech Dark",
+        background_color=(30, 30, 30),
+        title_color=(255, 255, 255),
+        text_color=(220, 220, 220),
+        accent_color=(0, 200, 150),
+        code_bg_color=(45, 45, 45),
+        title_font="Consolas",
+        body_font="Segoe UI",
+        title_size=36,
+        body_size=18,
+        code_size=14
+    ),
+    "education": ThemeConfig(
+        name="Education",
+        background_color=(255, 250, 240),
+        title_color=(70, 130, 180),
+        text_color=(60, 60, 60),
+        accent_color=(255, 140, 0),
+        code_bg_color=(245, 245, 245),
+        title_font="Georgia",
+        body_font="Verdana",
+        title_size=36,
+        body_size=18,
+        code_size=14
+    ),
+    "neumorphism": ThemeConfig(
+        name="Neumorphism",
+        background_color=(240, 243, 249),
+        title_color=(45, 55, 72),
+        text_color=(74, 85, 104),
+        accent_color=(66, 153, 225),
+        code_bg_color=(226, 232, 240),
+        title_font="Arial",
+        body_font="Arial",
+        title_size=36,
+        body_size=18,
+        code_size=14
+    )
+}
@@ -0,0 +1,97 @@
+"""
+Regression tests for pptx_generator slide creation.
+
+Run with: python -m pytest skills/md-to-pptx/tests
+"""
+
+import os
+import sys
+import zipfile
+from collections import Counter
+
+import pytest
+
+pytest.importorskip("pptx")
+
+SCRIPTS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "scripts")
+TEMPLATE = os.path.join(os.path.dirname(SCRIPTS_DIR), "assets", "templates", "business_template.pptx")
+if SCRIPTS_DIR not in sys.path:
+    sys.path.insert(0, SCRIPTS_DIR)
+
+from pptx import Presentation  # noqa: E402
+
+from md_parser import ContentElement, ContentType, MarkdownParser, SlideData  # noqa: E402
+from pptx_generator import PPTXGenerator  # noqa: E402
+
+TITLES = ["Slide %d" % i for i in range(1, 6)]
+MARKDOWN = "".join("## %s\n\n- point for %s\n\n" % (title, title) for title in TITLES)
+
+
+def _slide_title(slide) -> str:
+    """Text of the first text shape on the slide (the title box)."""
+    for shape in slide.shapes:
+        if shape.has_text_frame and shape.text_frame.text:
+            return shape.text_frame.text
+    return ""
+
+
+def _chart_slides(count):
+    return [
+        SlideData(
+            title="Chart %d" % i,
+            layout_hint="chart",
+            elements=[ContentElement(
+                type=ContentType.TABLE,
+                content={"headers": ["Quarter", "Sales"], "rows": [["Q1", "10"], ["Q2", "20"]]},
+            )],
+        )
+        for i in range(1, count + 1)
+    ]
+
+
+def _duplicate_entries(path):
+    with zipfile.ZipFile(path) as archive:
+        return [name for name, n in Counter(archive.namelist()).items() if n > 1]
+
+
+def _chart_entries(path, prefix):
+    with zipfile.ZipFile(path) as archive:
+        return [name for name in archive.namelist() if name.startswith(prefix)]
+
+
+@pytest.mark.parametrize("template", [None, TEMPLATE], ids=["blank", "template"])
+def test_generated_slides_have_unique_parts(tmp_path, template):
+    if template and not os.path.exists(template):
+        pytest.skip("template not available")
+
+    output = str(tmp_path / "deck.pptx")
+    generator = PPTXGenerator(template_path=template)
+    assert generator.generate(MarkdownParser().parse(MARKDOWN), output), generator.warnings
+
+    with zipfile.ZipFile(output) as archive:
+        names = [n for n in archive.namelist() if n.startswith("ppt/slides/slide")]
+    assert len(names) == len(set(names))
+
+    prs = Presentation(output)
+    partnames = [str(slide.part.partname) for slide in prs.slides]
+    assert len(partnames) == len(set(partnames))
+
+    generated = list(prs.slides)[-len(TITLES):]
+    assert [_slide_title(slide) for slide in generated] == TITLES
+
+
+def test_multiple_charts_get_unique_parts(tmp_path):
+    blank = str(tmp_path / "blank.pptx")
+    generator = PPTXGenerator()
+    assert generator.generate(_chart_slides(3), blank), generator.warnings
+    assert _duplicate_entries(blank) == []
+    assert len(_chart_entries(blank, "ppt/charts/chart")) == 3
+    assert len(_chart_entries(blank, "ppt/embeddings/")) == 3
+
+    # A template that already holds charts must not have its parts reused
+    reused = str(tmp_path / "reused.pptx")
+    generator = PPTXGenerator(template_path=blank)
+    assert generator.generate(_chart_slides(3), reused), generator.warnings
+    assert _duplicate_entries(reused) == []
+    assert len(_chart_entries(reused, "ppt/charts/chart")) == 6
+    assert len(_chart_entries(reused, "ppt/embeddings/")) == 6
@@ -13,14 +13,31 @@ align_all.py - 全量对齐所有 Skills 的经验
 选项:
     --dry-run   仅预览，不修改文件
     --backup    修改前备份原文件
+    --workers   并发数
+    --isolated  在子进程中缝合（每个并发槽一个常驻工作进程，批量处理）
 """
 
+import argparse
+import io
+import json
 import os
 import sys
 import subprocess
+import concurrent.futures
 from pathlib import Path
 from typing import List, Tuple
 
+# 同目录的 smart_stitch 作为模块导入，避免每个 Skill 启动一次解释器
+SCRIPT_DIR = Path(__file__).parent
+if str(SCRIPT_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPT_DIR))
+
+import smart_stitch
+
+
+# 默认并发数（缝合以文件 I/O 为主；--isolated 时主要耗时在等待子进程）
+DEFAULT_WORKERS = min(32, os.cpu_count() or 4)
+
 
 def find_skills_with_evolution(skills_root: str) -> List[Path]:
     """
@@ -32,27 +49,26 @@ def find_skills_with_evolution(skills_root: str) -> List[Path]:
     Returns:
         list: 包含 evolution.json 的 Skill 目录列表
     """
-    skills_path = Path(skills_root)
-    if not skills_path.exists():
+    if not os.path.isdir(skills_root):
         return []
 
-    result = []
-    for item in sorted(skills_path.iterdir()):
-        if not item.is_dir():
-            continue
-        if item.name.startswith('.'):
-            continue
+    found = []
+    # DirEntry 缓存了类型信息，省去逐项 stat；全程使用字符串路径
+    with os.scandir(skills_root) as it:
+        for entry in it:
+            if entry.name.startswith('.') or not entry.is_dir():
+                continue
+            if (os.path.isfile(os.path.join(entry.path, "evolution.json"))
+                    and os.path.isfile(os.path.join(entry.path, "SKILL.md"))):
+                found.append((entry.name, entry.path))
 
-        evolution_json = item / "evolution.json"
-        skill_md = item / "SKILL.md"
+    # 按名称排序后再构造 Path
+    found.sort()
+    return [Path(path) for _, path in found]
 
-        if evolution_json.exists() and skill_md.exists():
-            result.append(item)
 
-    return result
-
-
-def align_skill(skill_dir: Path, dry_run: bool = False, backup: bool = False) -> Tuple[bool, str]:
+def align_skill(skill_dir: Path, dry_run: bool = False, backup: bool = False,
+                isolated: bool = False) -> Tuple[bool, str]:
     """
     对齐单个 Skill
 
@@ -60,11 +76,32 @@ def align_skill(skill_dir: Path, dry_run: bool = False, backup: bool = False) ->
         skill_dir: Skill 目录
         dry_run: 是否仅预览
         backup: 是否备份
+        isolated: 是否在独立子进程中执行 smart_stitch.py
 
     Returns:
         tuple: (是否成功, 消息)
     """
-    stitch_script = Path(__file__).parent / "smart_stitch.py"
+    if isolated:
+        return _align_skill_subprocess(skill_dir, dry_run=dry_run, backup=backup)
+
+    # 输出写入各自的缓冲区，多线程并发时互不干扰
+    out, err = io.StringIO(), io.StringIO()
+    try:
+        success = smart_stitch.stitch_skill(
+            str(skill_dir), dry_run=dry_run, backup=backup, out=out, err=err
+        )
+    except Exception as e:
+        return False, str(e)
+
+    if success:
+        return True, out.getvalue().strip()
+    return False, err.getvalue().strip() or out.getvalue().strip()
+
+
+def _align_skill_subprocess(skill_dir: Path, dry_run: bool = False,
+                            backup: bool = False) -> Tuple[bool, str]:
+    """在子进程中运行 smart_stitch.py 对齐单个 Skill"""
+    stitch_script = SCRIPT_DIR / "smart_stitch.py"
 
     if not stitch_script.exists():
         return False, f"smart_stitch.py 不存在: {stitch_script}"
@@ -92,14 +129,87 @@ def align_skill(skill_dir: Path, dry_run: bool = False, backup: bool = False) ->
         return False, str(e)
 
 
-def align_all(skills_root: str, dry_run: bool = False, backup: bool = False) -> dict:
+def _run_stitch_worker(skill_dirs: List[Path], dry_run: bool = False,
+                       backup: bool = False) -> List[Tuple[bool, str]]:
+    """
+    启动一个 smart_stitch.py --worker 进程，批量对齐一组 Skills
+
+    工作进程异常退出或超时时，未返回结果的 Skill 逐个回退到独立子进程执行。
+    """
+    stitch_script = SCRIPT_DIR / "smart_stitch.py"
+
+    if not stitch_script.exists():
+        return [(False, f"smart_stitch.py 不存在: {stitch_script}")] * len(skill_dirs)
+
+    cmd = [sys.executable, str(stitch_script), '--worker']
+    if dry_run:
+        cmd.append('--dry-run')
+    if backup:
+        cmd.append('--backup')
+
+    payload = "".join(f"{d}\n" for d in skill_dirs)
+    results: List[Tuple[bool, str]] = []
+    try:
+        proc = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            encoding='utf-8'
+        )
+        try:
+            stdout, _ = proc.communicate(payload, timeout=30 * len(skill_dirs))
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            stdout, _ = proc.communicate()
+        for line in stdout.splitlines():
+            try:
+                item = json.loads(line)
+            except json.JSONDecodeError:
+                break
+            out, err = item["out"].strip(), item["err"].strip()
+            if item["success"]:
+                results.append((True, out))
+            else:
+                results.append((False, err or out))
+    except OSError:
+        pass
+
+    # 工作进程中途退出：剩余 Skill 每个单独起子进程
+    for skill_dir in skill_dirs[len(results):]:
+        results.append(_align_skill_subprocess(skill_dir, dry_run=dry_run, backup=backup))
+    return results
+
+
+def _align_isolated(skill_dirs: List[Path], dry_run: bool = False, backup: bool = False,
+                    max_workers: int = DEFAULT_WORKERS) -> List[Tuple[bool, str]]:
+    """在 max_workers 个常驻工作进程中对齐（轮询分配），按输入顺序返回结果"""
+    n = max(1, min(max_workers, len(skill_dirs)))
+    batches = [skill_dirs[i::n] for i in range(n)]
+
+    results: List[Tuple[bool, str]] = [(False, "")] * len(skill_dirs)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=n) as executor:
+        batch_results = executor.map(
+            lambda batch: _run_stitch_worker(batch, dry_run=dry_run, backup=backup),
+            batches
+        )
+        for i, batch_result in enumerate(batch_results):
+            results[i::n] = batch_result
+    return results
+
+
+def align_all(skills_root: str, dry_run: bool = False, backup: bool = False,
+              max_workers: int = DEFAULT_WORKERS, isolated: bool = False) -> dict:
     """
-    对齐所有 Skills
+    对齐所有 Skills（并发执行，按名称顺序输出）
 
     Args:
         skills_root: Skills 根目录
         dry_run: 是否仅预览
         backup: 是否备份
+        max_workers: 并发数
+        isolated: 是否每个 Skill 使用独立子进程
 
     Returns:
         dict: 统计结果
@@ -125,20 +235,35 @@ def align_all(skills_root: str, dry_run: bool = False, backup: bool = False) ->
     stats = {"total": len(skills_to_align), "success": 0, "failed": 0, "skipped": 0}
     failed_skills = []
 
-    for skill_dir in skills_to_align:
-        skill_name = skill_dir.name
-        print(f"\n处理: {skill_name}")
-
-        success, message = align_skill(skill_dir, dry_run=dry_run, backup=backup)
+    executor = None
+    if isolated:
+        # 子进程按并发槽常驻，批量处理，避免每个 Skill 启动一次解释器
+        results = _align_isolated(skills_to_align, dry_run=dry_run, backup=backup,
+                                  max_workers=max_workers)
+    else:
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=max(1, max_workers))
+        # map 按提交顺序产出结果，先完成的 Skill 不会打乱输出顺序
+        results = executor.map(
+            lambda skill_dir: align_skill(skill_dir, dry_run=dry_run, backup=backup),
+            skills_to_align
+        )
 
-        if success:
-            stats["success"] += 1
-            if message:
-                print(f"  {message}")
-        else:
-            stats["failed"] += 1
-            failed_skills.append((skill_name, message))
-            print(f"  ❌ 失败: {message}")
+    try:
+        for skill_dir, (success, message) in zip(skills_to_align, results):
+            skill_name = skill_dir.name
+            print(f"\n处理: {skill_name}")
+
+            if success:
+                stats["success"] += 1
+                if message:
+                    print(f"  {message}")
+            else:
+                stats["failed"] += 1
+                failed_skills.append((skill_name, message))
+                print(f"  ❌ 失败: {message}")
+    finally:
+        if executor is not None:
+            executor.shutdown()
 
     # 输出统计
     print("\n" + "=" * 40)
@@ -155,17 +280,31 @@ def align_all(skills_root: str, dry_run: bool = False, backup: bool = False) ->
     return stats
 
 
-def main():
-    import argparse
+def positive_int(value: str) -> int:
+    """argparse 参数类型：不小于 1 的整数"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"无效的整数: {value}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"必须不小于 1: {value}")
+    return number
 
+
+def main():
     parser = argparse.ArgumentParser(description='全量对齐所有 Skills 的经验')
     parser.add_argument('skills_dir', help='Skills 目录路径')
     parser.add_argument('--dry-run', action='store_true', help='仅预览，不修改文件')
     parser.add_argument('--backup', '-b', action='store_true', help='修改前备份原文件')
+    parser.add_argument('--workers', '-w', type=positive_int, default=DEFAULT_WORKERS,
+                        help=f'并发数 (默认: {DEFAULT_WORKERS})')
+    parser.add_argument('--isolated', action='store_true',
+                        help='每个 Skill 在独立子进程中缝合')
 
     args = parser.parse_args()
 
-    stats = align_all(args.skills_dir, dry_run=args.dry_run, backup=args.backup)
+    stats = align_all(args.skills_dir, dry_run=args.dry_run, backup=args.backup,
+                      max_workers=args.workers, isolated=args.isolated)
 
     # 根据结果设置退出码
     if stats["failed"] > 0:
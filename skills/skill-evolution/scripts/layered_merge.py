@@ -19,16 +19,87 @@ layered_merge.py - 分层经验合并器
 
 import json
 import os
+import stat
 import sys
+import tempfile
+import threading
+from contextlib import contextmanager
+from functools import cached_property
+from itertools import chain
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable, Iterator
 from datetime import datetime
 
+# 优先使用 orjson 解析/序列化 JSON（可选依赖）
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# 经验字段：列表字段追加去重，custom_prompts 为单值
+_LIST_FIELDS = ("preferences", "fixes", "contexts")
+_ALL_FIELDS = _LIST_FIELDS + ("custom_prompts",)
+
+
+def load_json_bytes(raw: bytes):
+    """解析 UTF-8 编码的 JSON，有 orjson 时使用 orjson"""
+    if HAS_ORJSON:
+        return orjson.loads(raw)
+    return json.loads(raw.decode('utf-8'))
+
+
+def dump_json(obj) -> bytes:
+    """序列化为缩进 JSON（UTF-8 字节），有 orjson 时使用 orjson"""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+# bulk_writes() 期间延迟 fsync 的文件（线程局部）
+_bulk_state = threading.local()
+
+
+def write_bytes_atomic(path: Path, payload: bytes, durable: bool = True) -> None:
+    """
+    原子写入文件：先写同目录的唯一临时文件，再 os.replace 覆盖目标
+
+    Args:
+        path: 目标文件路径
+        payload: 文件内容
+        durable: 是否 fsync（默认是）。在 bulk_writes() 中时不逐个 fsync，
+                 改为记录路径，退出上下文时统一 fsync
+    """
+    pending = getattr(_bulk_state, 'pending', None)
+    # 沿用目标文件权限；mkstemp 默认创建 0600 文件
+    try:
+        mode = stat.S_IMODE(os.stat(path).st_mode)
+    except OSError:
+        mode = 0o644
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name + '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+            if durable and pending is None:
+                f.flush()
+                os.fsync(f.fileno())
+        os.chmod(tmp, mode)
+        os.replace(tmp, path)
+    except OSError:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+    if durable and pending is not None:
+        pending.append(path)
+
 
 class LayeredEvolutionManager:
     """分层经验管理器"""
 
-    def __init__(self, skill_name: str, project_path: Optional[str] = None):
+    def __init__(self, skill_name: str, project_path: Optional[str] = None,
+                 config: Optional[dict] = None):
         self.skill_name = skill_name
         self.project_path = Path(project_path).resolve() if project_path else Path.cwd()
 
@@ -36,8 +107,8 @@ class LayeredEvolutionManager:
         self.home = Path.home()
         self.claude_dir = self.home / ".claude"
 
-        # 加载配置
-        self.config = self._load_config()
+        # 加载配置（批量操作时由调用方传入，避免重复读取）
+        self.config = config if config is not None else self._load_config()
 
         # 解析路径
         self.skills_repo = Path(os.path.expanduser(
@@ -51,44 +122,169 @@ class LayeredEvolutionManager:
         self.project_evolutions_dir = self.config.get("project_evolutions_dir", ".claude/evolutions")
         self.project_evolutions = self.project_path / self.project_evolutions_dir
 
+        # 已解析的 JSON 文件（每个实例对应一次命令，同一文件只读一次）
+        self._json_cache: Dict[Path, dict] = {}
+
     def _load_config(self) -> dict:
         """加载全局配置"""
         config_path = self.claude_dir / "evolutions" / "config.json"
         if config_path.exists():
             try:
-                return json.loads(config_path.read_text(encoding='utf-8'))
+                return load_json_bytes(config_path.read_bytes())
             except (json.JSONDecodeError, IOError):
                 pass
         return {}
 
     def _load_json(self, path: Path) -> dict:
-        """安全加载 JSON 文件"""
-        if path.exists():
-            try:
-                return json.loads(path.read_text(encoding='utf-8'))
-            except (json.JSONDecodeError, IOError):
-                return {}
-        return {}
-
-    def _save_json(self, path: Path, data: dict) -> bool:
-        """保存 JSON 文件"""
+        """安全加载 JSON 文件（带实例级缓存，返回可自由修改的副本）"""
+        data = self._json_cache.get(path)
+        if data is None:
+            data = {}
+            if path.exists():
+                try:
+                    data = load_json_bytes(path.read_bytes())
+                except (json.JSONDecodeError, IOError):
+                    data = {}
+            self._json_cache[path] = data
+        return self._copy_evolution(data)
+
+    @staticmethod
+    def _copy_evolution(data: dict) -> dict:
+        """复制经验数据：调用方会就地追加列表字段，列表需单独复制"""
+        if not isinstance(data, dict):
+            return data
+        return {k: list(v) if isinstance(v, list) else v for k, v in data.items()}
+
+    def _save_json(self, path: Path, data: dict, durable: bool = True) -> bool:
+        """保存 JSON 文件（原子替换；默认 fsync，bulk_writes() 中推迟到退出时）"""
         try:
             path.parent.mkdir(parents=True, exist_ok=True)
-            path.write_text(
-                json.dumps(data, indent=2, ensure_ascii=False),
-                encoding='utf-8'
-            )
+            write_bytes_atomic(path, dump_json(data), durable)
+            self._json_cache.pop(path, None)
             return True
         except IOError as e:
             print(f"错误: 无法写入文件 {path}: {e}", file=sys.stderr)
             return False
 
+    @classmethod
+    def iter_all_skills(cls, project_path: Optional[str] = None,
+                        layer: str = "global") -> Iterator["LayeredEvolutionManager"]:
+        """
+        遍历指定层中有经验数据的所有 Skills（按名称排序）
+
+        Args:
+            project_path: 项目路径
+            layer: "global" 扫描 <global>/<skill>/evolution.json，
+                   "project" 扫描 <project>/.claude/evolutions/<skill>.json
+
+        Yields:
+            LayeredEvolutionManager: 共用同一份配置的管理器实例
+        """
+        probe = cls("", project_path)
+        config_path = probe.claude_dir / "evolutions" / "config.json"
+
+        names = []
+        try:
+            if layer == "global":
+                with os.scandir(probe.global_evolutions) as it:
+                    for entry in it:
+                        if (not entry.name.startswith('.') and entry.is_dir()
+                                and os.path.isfile(os.path.join(entry.path, "evolution.json"))):
+                            names.append(entry.name)
+            elif layer == "project":
+                with os.scandir(probe.project_evolutions) as it:
+                    for entry in it:
+                        if (entry.name.endswith('.json') and not entry.name.startswith('.')
+                                and entry.is_file() and Path(entry.path) != config_path):
+                            names.append(entry.name[:-len('.json')])
+        except OSError:
+            return
+
+        for name in sorted(names):
+            yield cls(name, project_path, config=probe.config)
+
+    @classmethod
+    def _run_all(cls, layer: str, action: Callable[["LayeredEvolutionManager"], dict],
+                 project_path: Optional[str] = None) -> dict:
+        """对指定层中的所有 Skills 执行操作，汇总结果"""
+        results = {}
+        with cls.bulk_writes():
+            for manager in cls.iter_all_skills(project_path, layer):
+                results[manager.skill_name] = action(manager)
+
+        failed = [name for name, result in results.items() if result.get("status") == "error"]
+        return {
+            "status": "error" if failed else "success",
+            "total": len(results),
+            "failed": failed,
+            "results": results
+        }
+
+    @classmethod
+    def promote_all(cls, project_path: Optional[str] = None,
+                    fields: Optional[List[str]] = None) -> dict:
+        """将项目层中所有 Skills 的经验提升到全局层"""
+        return cls._run_all("project", lambda m: m.promote_to_global(fields), project_path)
+
+    @classmethod
+    def pull_all(cls, project_path: Optional[str] = None) -> dict:
+        """从全局层拉取所有 Skills 的经验到项目层"""
+        return cls._run_all("global", lambda m: m.pull_from_global(), project_path)
+
+    @classmethod
+    @contextmanager
+    def bulk_writes(cls):
+        """
+        批量写入上下文：期间的写入不逐个 fsync，退出时统一 fsync 一次
+
+        上下文之外的单次写入各自 fsync。
+
+        用法:
+            with LayeredEvolutionManager.bulk_writes():
+                for name in skills:
+                    LayeredEvolutionManager(name).promote_to_global()
+        """
+        outer = getattr(_bulk_state, 'pending', None)
+        if outer is not None:
+            # 嵌套时由最外层统一 fsync
+            yield
+            return
+        _bulk_state.pending = []
+        try:
+            yield
+        finally:
+            pending, _bulk_state.pending = _bulk_state.pending, None
+            for path in dict.fromkeys(pending):
+                try:
+                    fd = os.open(path, os.O_RDONLY)
+                except OSError:
+                    continue
+                try:
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
+
+    @staticmethod
+    def _normalize(item) -> str:
+        """去重比较用的标准化值"""
+        return item.strip() if isinstance(item, str) else str(item)
+
+    def _build_normalized_set(self, items: list) -> set:
+        """构建列表的标准化值集合，用于 O(1) 成员判断"""
+        return {self._normalize(x) for x in items}
+
     def _dedupe_list(self, items: list) -> list:
         """列表去重（保持顺序）"""
+        if all(type(item) is str for item in items):
+            # 常见情况：全是字符串，用 dict 一次完成有序去重；
+            # 反向建表使每个标准化值对应首次出现的原始项
+            stripped = list(map(str.strip, items))
+            first = dict(zip(reversed(stripped), reversed(items)))
+            return [first[key] for key in dict.fromkeys(stripped)]
         seen = set()
         result = []
         for item in items:
-            normalized = item.strip() if isinstance(item, str) else str(item)
+            normalized = self._normalize(item)
             if normalized not in seen:
                 seen.add(normalized)
                 result.append(item)
@@ -96,34 +292,74 @@ class LayeredEvolutionManager:
 
     # ==================== 路径获取 ====================
 
+    # 路径在实例生命周期内不变，首次访问后缓存
+
+    @cached_property
+    def upstream_file(self) -> Path:
+        """上游层 evolution.json 路径"""
+        return self.skills_repo / self.skill_name / "evolution.json"
+
+    @cached_property
+    def global_file(self) -> Path:
+        """全局层 evolution.json 路径"""
+        return self.global_evolutions / self.skill_name / "evolution.json"
+
+    @cached_property
+    def project_file(self) -> Path:
+        """项目层 evolution.json 路径"""
+        return self.project_evolutions / f"{self.skill_name}.json"
+
     def get_upstream_path(self) -> Path:
         """获取上游层 evolution.json 路径"""
-        return self.skills_repo / self.skill_name / "evolution.json"
+        return self.upstream_file
 
     def get_global_path(self) -> Path:
         """获取全局层 evolution.json 路径"""
-        return self.global_evolutions / self.skill_name / "evolution.json"
+        return self.global_file
 
     def get_project_path(self) -> Path:
         """获取项目层 evolution.json 路径"""
-        return self.project_evolutions / f"{self.skill_name}.json"
+        return self.project_file
 
     # ==================== 数据获取 ====================
 
     def get_upstream_evolution(self) -> dict:
         """获取上游层经验（来自 skills-repo）"""
-        return self._load_json(self.get_upstream_path())
+        return self._load_json(self.upstream_file)
 
     def get_global_evolution(self) -> dict:
         """获取全局层经验"""
-        return self._load_json(self.get_global_path())
+        return self._load_json(self.global_file)
 
     def get_project_evolution(self) -> dict:
         """获取项目层经验"""
-        return self._load_json(self.get_project_path())
+        return self._load_json(self.project_file)
 
     # ==================== 核心功能 ====================
 
+    def _merge_payload(self, upstream: dict, global_evo: dict, project: dict) -> dict:
+        """合并三层经验内容（不含 _meta）"""
+        merged = {}
+
+        # 按优先级合并列表字段（去重）
+        for field in _LIST_FIELDS:
+            # 按优先级顺序：上游 → 全局 → 项目
+            merged[field] = self._dedupe_list(list(chain(
+                upstream.get(field, ()),
+                global_evo.get(field, ()),
+                project.get(field, ())
+            )))
+
+        # custom_prompts: 项目层覆盖
+        merged["custom_prompts"] = (
+            project.get("custom_prompts") or
+            global_evo.get("custom_prompts") or
+            upstream.get("custom_prompts") or
+            ""
+        )
+
+        return merged
+
     def get_merged_evolution(self) -> dict:
         """
         合并三层经验，返回最终结果
@@ -136,48 +372,27 @@ class LayeredEvolutionManager:
         global_evo = self.get_global_evolution()
         project = self.get_project_evolution()
 
-        merged = {
-            "preferences": [],
-            "fixes": [],
-            "contexts": [],
-            "custom_prompts": "",
-            "_meta": {
-                "merged_at": datetime.now().isoformat(),
-                "skill_name": self.skill_name,
-                "project_path": str(self.project_path),
-                "layers": {
-                    "upstream": {
-                        "exists": bool(upstream),
-                        "path": str(self.get_upstream_path())
-                    },
-                    "global": {
-                        "exists": bool(global_evo),
-                        "path": str(self.get_global_path())
-                    },
-                    "project": {
-                        "exists": bool(project),
-                        "path": str(self.get_project_path())
-                    }
+        merged = self._merge_payload(upstream, global_evo, project)
+        merged["_meta"] = {
+            "merged_at": datetime.now().isoformat(),
+            "skill_name": self.skill_name,
+            "project_path": str(self.project_path),
+            "layers": {
+                "upstream": {
+                    "exists": bool(upstream),
+                    "path": str(self.upstream_file)
+                },
+                "global": {
+                    "exists": bool(global_evo),
+                    "path": str(self.global_file)
+                },
+                "project": {
+                    "exists": bool(project),
+                    "path": str(self.project_file)
                 }
             }
         }
 
-        # 按优先级合并列表字段（去重）
-        for field in ["preferences", "fixes", "contexts"]:
-            items = []
-            # 按优先级顺序：上游 → 全局 → 项目
-            for layer in [upstream, global_evo, project]:
-                items.extend(layer.get(field, []))
-            merged[field] = self._dedupe_list(items)
-
-        # custom_prompts: 项目层覆盖
-        merged["custom_prompts"] = (
-            project.get("custom_prompts") or
-            global_evo.get("custom_prompts") or
-            upstream.get("custom_prompts") or
-            ""
-        )
-
         return merged
 
     def save_to_layer(self, layer: str, data: dict) -> dict:
@@ -192,9 +407,9 @@ class LayeredEvolutionManager:
             dict: 操作结果
         """
         if layer == "global":
-            path = self.get_global_path()
+            path = self.global_file
         elif layer == "project":
-            path = self.get_project_path()
+            path = self.project_file
         elif layer == "upstream":
             return {
                 "status": "error",
@@ -210,11 +425,11 @@ class LayeredEvolutionManager:
         existing = self._load_json(path)
 
         # 合并列表字段
-        for field in ["preferences", "fixes", "contexts"]:
+        for field in _LIST_FIELDS:
             if field in data:
                 existing_items = existing.get(field, [])
                 new_items = data[field] if isinstance(data[field], list) else [data[field]]
-                existing[field] = self._dedupe_list(existing_items + new_items)
+                existing[field] = self._dedupe_list(list(chain(existing_items, new_items)))
 
         # 覆盖 custom_prompts
         if "custom_prompts" in data and data["custom_prompts"]:
@@ -253,10 +468,10 @@ class LayeredEvolutionManager:
             return {
                 "status": "error",
                 "message": f"项目层没有 {self.skill_name} 的经验数据",
-                "path": str(self.get_project_path())
+                "path": str(self.project_file)
             }
 
-        fields = fields or ["preferences", "fixes", "contexts", "custom_prompts"]
+        fields = fields or _ALL_FIELDS
         promoted = {
             "status": "success",
             "items": [],
@@ -275,14 +490,15 @@ class LayeredEvolutionManager:
             else:
                 project_items = project.get(field, [])
                 global_items = global_evo.get(field, [])
+                global_normalized = self._build_normalized_set(global_items)
 
                 for item in project_items:
-                    normalized = item.strip() if isinstance(item, str) else str(item)
-                    global_normalized = [
-                        x.strip() if isinstance(x, str) else str(x)
-                        for x in global_items
-                    ]
+                    normalized = self._normalize(item)
                     if normalized not in global_normalized:
+                        global_normalized.add(normalized)
+                        # 字符串按去除首尾空白后的值写入，避免空白变体混入目标层
+                        if isinstance(item, str):
+                            item = normalized
                         global_items.append(item)
                         promoted["items"].append({
                             "field": field,
@@ -293,8 +509,8 @@ class LayeredEvolutionManager:
 
         if promoted["items"]:
             global_evo["last_updated"] = datetime.now().isoformat()
-            if self._save_json(self.get_global_path(), global_evo):
-                promoted["path"] = str(self.get_global_path())
+            if self._save_json(self.global_file, global_evo):
+                promoted["path"] = str(self.global_file)
                 promoted["total_promoted"] = len(promoted["items"])
             else:
                 return {
@@ -320,7 +536,7 @@ class LayeredEvolutionManager:
             return {
                 "status": "error",
                 "message": f"全局层没有 {self.skill_name} 的经验数据",
-                "path": str(self.get_global_path())
+                "path": str(self.global_file)
             }
 
         pulled = {
@@ -331,17 +547,18 @@ class LayeredEvolutionManager:
         }
 
         # 合并列表字段
-        for field in ["preferences", "fixes", "contexts"]:
+        for field in _LIST_FIELDS:
             global_items = global_evo.get(field, [])
             project_items = project.get(field, [])
+            project_normalized = self._build_normalized_set(project_items)
 
             for item in global_items:
-                normalized = item.strip() if isinstance(item, str) else str(item)
-                project_normalized = [
-                    x.strip() if isinstance(x, str) else str(x)
-                    for x in project_items
-                ]
+                normalized = self._normalize(item)
                 if normalized not in project_normalized:
+                    project_normalized.add(normalized)
+                    # 字符串按去除首尾空白后的值写入，避免空白变体混入目标层
+                    if isinstance(item, str):
+                        item = normalized
                     project_items.append(item)
                     pulled["items"].append({
                         "field": field,
@@ -359,10 +576,11 @@ class LayeredEvolutionManager:
             })
 
         if pulled["items"]:
-            project["last_updated"] = datetime.now().isoformat()
-            project["pulled_from_global_at"] = datetime.now().isoformat()
-            if self._save_json(self.get_project_path(), project):
-                pulled["path"] = str(self.get_project_path())
+            now_iso = datetime.now().isoformat()
+            project["last_updated"] = now_iso
+            project["pulled_from_global_at"] = now_iso
+            if self._save_json(self.project_file, project):
+                pulled["path"] = str(self.project_file)
                 pulled["total_pulled"] = len(pulled["items"])
             else:
                 return {
@@ -386,40 +604,46 @@ class LayeredEvolutionManager:
         project = self.get_project_evolution()
 
         def count_items(data: dict) -> dict:
+            prefs = len(data.get("preferences", []))
+            fixes = len(data.get("fixes", []))
+            contexts = len(data.get("contexts", []))
             return {
-                "preferences": len(data.get("preferences", [])),
-                "fixes": len(data.get("fixes", [])),
-                "contexts": len(data.get("contexts", [])),
+                "preferences": prefs,
+                "fixes": fixes,
+                "contexts": contexts,
                 "has_custom_prompts": bool(data.get("custom_prompts")),
-                "total": sum(len(data.get(k, [])) for k in ["preferences", "fixes", "contexts"])
+                "total": prefs + fixes + contexts
             }
 
+        # 合并结果只计算一次；状态只需计数，不构建 _meta
+        merged = self._merge_payload(upstream, global_evo, project)
+
         return {
             "skill_name": self.skill_name,
             "project_path": str(self.project_path),
             "layers": {
                 "upstream": {
                     "exists": bool(upstream),
-                    "path": str(self.get_upstream_path()),
+                    "path": str(self.upstream_file),
                     "counts": count_items(upstream) if upstream else None,
                     "last_updated": upstream.get("last_updated")
                 },
                 "global": {
                     "exists": bool(global_evo),
-                    "path": str(self.get_global_path()),
+                    "path": str(self.global_file),
                     "counts": count_items(global_evo) if global_evo else None,
                     "last_updated": global_evo.get("last_updated")
                 },
                 "project": {
                     "exists": bool(project),
-                    "path": str(self.get_project_path()),
+                    "path": str(self.project_file),
                     "counts": count_items(project) if project else None,
                     "last_updated": project.get("last_updated")
                 }
             },
             "merged_total": sum(
-                len(self.get_merged_evolution().get(k, []))
-                for k in ["preferences", "fixes", "contexts"]
+                len(merged.get(k, []))
+                for k in _LIST_FIELDS
             )
         }
 
@@ -444,6 +668,10 @@ def main():
   # 从全局拉取经验到项目
   python layered_merge.py pull n8n-code-javascript
 
+  # 对所有 Skills 批量提升 / 拉取
+  python layered_merge.py promote --all
+  python layered_merge.py pull --all
+
   # 保存经验到指定层
   python layered_merge.py save n8n-code-javascript global '{"preferences": ["偏好1"]}'
         """
@@ -456,7 +684,8 @@ def main():
     )
     parser.add_argument(
         'skill_name',
-        help='Skill 名称'
+        nargs='?',
+        help='Skill 名称（promote/pull 使用 --all 时省略）'
     )
     parser.add_argument(
         'extra_args',
@@ -473,6 +702,11 @@ def main():
         help='要操作的字段（逗号分隔）',
         default=None
     )
+    parser.add_argument(
+        '--all', '-a',
+        action='store_true',
+        help='对所有 Skills 执行（仅 promote/pull）'
+    )
     parser.add_argument(
         '--json', '-j',
         action='store_true',
@@ -481,9 +715,21 @@ def main():
 
     args = parser.parse_args()
 
-    manager = LayeredEvolutionManager(args.skill_name, args.project)
+    if args.all and args.action not in ('promote', 'pull'):
+        parser.error('--all 仅支持 promote 和 pull')
+    if not args.all and not args.skill_name:
+        parser.error('缺少 skill_name 参数')
+
+    manager = None if args.all else LayeredEvolutionManager(args.skill_name, args.project)
+
+    if args.action == 'promote' and args.all:
+        fields = args.fields.split(',') if args.fields else None
+        result = LayeredEvolutionManager.promote_all(args.project, fields)
+
+    elif args.action == 'pull' and args.all:
+        result = LayeredEvolutionManager.pull_all(args.project)
 
-    if args.action == 'status':
+    elif args.action == 'status':
         result = manager.get_status()
 
     elif args.action == 'merge':
@@ -514,7 +760,8 @@ def main():
         result = manager.save_to_layer(layer, data)
 
     # 输出结果
-    print(json.dumps(result, indent=2, ensure_ascii=False))
+    sys.stdout.flush()
+    sys.stdout.buffer.write(dump_json(result) + b"\n")
 
     # 根据结果设置退出码
     if isinstance(result, dict) and result.get("status") == "error":
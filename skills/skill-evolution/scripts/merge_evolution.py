@@ -26,28 +26,77 @@ merge_evolution.py - 增量合并经验数据
 import os
 import sys
 import json
-import datetime
+import stat
+import tempfile
+from datetime import datetime
 from pathlib import Path
 from typing import Union
 
+# 优先使用 orjson 解析/序列化 JSON（可选依赖）
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# 需要追加去重的列表字段
+_LIST_FIELDS = ('preferences', 'fixes', 'contexts')
+
+
+def load_json_bytes(raw: bytes):
+    """解析 UTF-8 编码的 JSON，有 orjson 时使用 orjson"""
+    if HAS_ORJSON:
+        return orjson.loads(raw)
+    return json.loads(raw.decode('utf-8'))
+
+
+def dump_json(obj) -> bytes:
+    """序列化为缩进 JSON（UTF-8 字节），有 orjson 时使用 orjson"""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
 
 def load_evolution(evolution_path: Path) -> dict:
     """加载现有的 evolution.json"""
     if evolution_path.exists():
         try:
-            return json.loads(evolution_path.read_text(encoding='utf-8'))
+            return load_json_bytes(evolution_path.read_bytes())
         except (json.JSONDecodeError, IOError):
             pass
     return {}
 
 
 def save_evolution(evolution_path: Path, data: dict) -> bool:
-    """保存 evolution.json"""
+    """保存 evolution.json（内容与磁盘一致时跳过写入）"""
+    payload = dump_json(data)
+    try:
+        if evolution_path.read_bytes() == payload:
+            return True
+    except IOError:
+        pass
     try:
-        evolution_path.write_text(
-            json.dumps(data, indent=2, ensure_ascii=False),
-            encoding='utf-8'
-        )
+        # 先写唯一的临时文件再原子替换，避免中途失败留下截断的 evolution.json，
+        # 并发写入同一文件时也不会互相覆盖临时文件
+        try:
+            mode = stat.S_IMODE(os.stat(evolution_path).st_mode)
+        except IOError:
+            mode = 0o644
+        fd, tmp_path = tempfile.mkstemp(dir=evolution_path.parent,
+                                        prefix=evolution_path.name + '.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.chmod(tmp_path, mode)
+            os.replace(tmp_path, evolution_path)
+        except IOError:
+            try:
+                os.unlink(tmp_path)
+            except IOError:
+                pass
+            raise
         return True
     except IOError as e:
         print(f"错误: 无法写入文件: {e}", file=sys.stderr)
@@ -57,14 +106,27 @@ def save_evolution(evolution_path: Path, data: dict) -> bool:
 def merge_list_dedupe(existing: list, new_items: list) -> list:
     """合并列表并去重（保持顺序）"""
     result = list(existing)
+    # 标准化比较（去除首尾空格）；标准化值集合只构建一次，
+    # 不可哈希的值（如嵌套对象）退回列表比较
+    seen = set()
+    seen_unhashable = []
+
+    def is_new(normalized) -> bool:
+        try:
+            if normalized in seen:
+                return False
+            seen.add(normalized)
+        except TypeError:
+            if normalized in seen_unhashable:
+                return False
+            seen_unhashable.append(normalized)
+        return True
+
+    for x in result:
+        is_new(x.strip() if isinstance(x, str) else x)
+
     for item in new_items:
-        # 标准化比较（去除首尾空格）
-        item_normalized = item.strip() if isinstance(item, str) else item
-        existing_normalized = [
-            x.strip() if isinstance(x, str) else x
-            for x in result
-        ]
-        if item_normalized not in existing_normalized:
+        if is_new(item.strip() if isinstance(item, str) else item):
             result.append(item)
     return result
 
@@ -97,7 +159,7 @@ def merge_evolution(skill_dir: str, new_data: Union[str, dict]) -> bool:
         # 检查是否是文件路径
         if os.path.isfile(new_data):
             try:
-                new_data = json.loads(Path(new_data).read_text(encoding='utf-8'))
+                new_data = load_json_bytes(Path(new_data).read_bytes())
             except (json.JSONDecodeError, IOError) as e:
                 print(f"错误: 无法读取 JSON 文件: {e}", file=sys.stderr)
                 return False
@@ -114,20 +176,23 @@ def merge_evolution(skill_dir: str, new_data: Union[str, dict]) -> bool:
 
     # 加载现有数据
     current_data = load_evolution(evolution_path)
-
-    # 记录合并前的状态
-    items_before = sum(len(current_data.get(k, [])) for k in ['preferences', 'fixes', 'contexts'])
+    # 合并只替换字段值、不原地修改，浅拷贝即可用于变化判断
+    original_data = dict(current_data)
 
     # 更新时间戳
-    current_data['last_updated'] = datetime.datetime.now().isoformat()
-
-    # 合并列表字段（去重）
-    for list_key in ['preferences', 'fixes', 'contexts']:
-        if list_key in new_data:
-            existing_list = current_data.get(list_key, [])
-            new_items = new_data[list_key]
-            if isinstance(new_items, list):
-                current_data[list_key] = merge_list_dedupe(existing_list, new_items)
+    current_data['last_updated'] = datetime.now().isoformat()
+
+    # 合并列表字段（去重），同时累计合并前总数与新增数
+    items_before = 0
+    items_added = 0
+    for list_key in _LIST_FIELDS:
+        existing_list = current_data.get(list_key, [])
+        items_before += len(existing_list)
+        new_items = new_data.get(list_key)
+        if isinstance(new_items, list):
+            merged = merge_list_dedupe(existing_list, new_items)
+            items_added += len(merged) - len(existing_list)
+            current_data[list_key] = merged
 
     # 处理 custom_prompts（覆盖）
     if 'custom_prompts' in new_data and new_data['custom_prompts']:
@@ -137,15 +202,22 @@ def merge_evolution(skill_dir: str, new_data: Union[str, dict]) -> bool:
     if 'last_evolved_hash' in new_data:
         current_data['last_evolved_hash'] = new_data['last_evolved_hash']
 
+    # 统计
+    items_after = items_before + items_added
+
+    skill_name = skill_path.name
+
+    # 除时间戳外没有变化：不重写文件
+    original_data['last_updated'] = current_data['last_updated']
+    if evolution_path.exists() and current_data == original_data:
+        print(f"✅ 经验数据无变化: {skill_name}")
+        print(f"   新增 0 条记录（总计 {items_after} 条）")
+        return True
+
     # 保存
     if not save_evolution(evolution_path, current_data):
         return False
 
-    # 统计
-    items_after = sum(len(current_data.get(k, [])) for k in ['preferences', 'fixes', 'contexts'])
-    items_added = items_after - items_before
-
-    skill_name = skill_path.name
     print(f"✅ 已合并经验数据: {skill_name}")
     print(f"   新增 {items_added} 条记录（总计 {items_after} 条）")
 
@@ -176,7 +248,7 @@ def merge_evolution_layered(skill_name: str, new_data: Union[str, dict],
     if isinstance(new_data, str):
         if os.path.isfile(new_data):
             try:
-                new_data = json.loads(Path(new_data).read_text(encoding='utf-8'))
+                new_data = load_json_bytes(Path(new_data).read_bytes())
             except (json.JSONDecodeError, IOError) as e:
                 print(f"错误: 无法读取 JSON 文件: {e}", file=sys.stderr)
                 return False
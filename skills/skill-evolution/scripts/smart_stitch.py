@@ -20,6 +20,7 @@ smart_stitch.py - 智能缝合经验到 SKILL.md
     --backup    修改前备份原文件
     --layered   启用分层合并模式
     --project   项目路径（分层模式下使用，默认当前目录）
+    --worker    工作进程模式：从 stdin 逐行读取 Skill 目录，每行输出一条 JSON 结果
 """
 
 import os
@@ -30,12 +31,23 @@ import datetime
 import shutil
 from pathlib import Path
 
+# 优先使用 orjson 解析/序列化 JSON（可选依赖）
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# 可缝合的经验字段
+_CONTENT_FIELDS = ('preferences', 'fixes', 'contexts', 'custom_prompts')
+
 
 # 章节标题（用于匹配和替换）
 SECTION_TITLE = "## User-Learned Best Practices & Constraints"
 
 # 章节开始的正则模式
 SECTION_PATTERN = r'(\n+## User-Learned Best Practices & Constraints.*?)(?=\n## |\Z)'
+_SECTION_RE = re.compile(SECTION_PATTERN, re.DOTALL)
 
 
 def load_evolution(evolution_path: Path) -> dict:
@@ -43,6 +55,8 @@ def load_evolution(evolution_path: Path) -> dict:
     if not evolution_path.exists():
         return {}
     try:
+        if HAS_ORJSON:
+            return orjson.loads(evolution_path.read_bytes())
         return json.loads(evolution_path.read_text(encoding='utf-8'))
     except (json.JSONDecodeError, IOError):
         return {}
@@ -137,7 +151,8 @@ def generate_evolution_section(data: dict, layered: bool = False) -> str:
 
 
 def stitch_skill(skill_dir: str, dry_run: bool = False, backup: bool = False,
-                  layered: bool = False, project_path: str = None) -> bool:
+                  layered: bool = False, project_path: str = None,
+                  out=None, err=None) -> bool:
     """
     将 evolution.json 缝合到 SKILL.md
 
@@ -147,17 +162,21 @@ def stitch_skill(skill_dir: str, dry_run: bool = False, backup: bool = False,
         backup: 是否备份原文件
         layered: 是否启用分层合并模式
         project_path: 项目路径（分层模式下使用）
+        out: 信息输出流（默认 sys.stdout）
+        err: 错误输出流（默认 sys.stderr）
 
     Returns:
         bool: 是否成功
     """
+    out = out or sys.stdout
+    err = err or sys.stderr
     skill_path = Path(skill_dir)
     skill_md_path = skill_path / "SKILL.md"
     evolution_path = skill_path / "evolution.json"
 
     # 检查 SKILL.md
     if not skill_md_path.exists():
-        print(f"错误: SKILL.md 不存在: {skill_md_path}", file=sys.stderr)
+        print(f"错误: SKILL.md 不存在: {skill_md_path}", file=err)
         return False
 
     # 加载数据
@@ -171,18 +190,18 @@ def stitch_skill(skill_dir: str, dry_run: bool = False, backup: bool = False,
     else:
         # 单层模式：仅读取本地 evolution.json
         if not evolution_path.exists():
-            print(f"信息: 没有 evolution.json，跳过: {skill_path.name}")
+            print(f"信息: 没有 evolution.json，跳过: {skill_path.name}", file=out)
             return True
         data = load_evolution(evolution_path)
 
     if not data:
-        print(f"信息: evolution.json 为空，跳过: {skill_path.name}")
+        print(f"信息: evolution.json 为空，跳过: {skill_path.name}", file=out)
         return True
 
     # 检查是否有实际内容
-    has_content = any(data.get(k) for k in ['preferences', 'fixes', 'contexts', 'custom_prompts'])
+    has_content = any(data.get(k) for k in _CONTENT_FIELDS)
     if not has_content:
-        print(f"信息: 没有可缝合的内容，跳过: {skill_path.name}")
+        print(f"信息: 没有可缝合的内容，跳过: {skill_path.name}", file=out)
         return True
 
     # 生成新章节
@@ -192,7 +211,7 @@ def stitch_skill(skill_dir: str, dry_run: bool = False, backup: bool = False,
     content = skill_md_path.read_text(encoding='utf-8')
 
     # 查找并替换或追加
-    match = re.search(SECTION_PATTERN, content, re.DOTALL)
+    match = _SECTION_RE.search(content)
 
     if match:
         # 替换现有章节
@@ -204,10 +223,10 @@ def stitch_skill(skill_dir: str, dry_run: bool = False, backup: bool = False,
         action = "追加"
 
     if dry_run:
-        print(f"[Dry Run] 将要{action}章节到: {skill_path.name}")
-        print("-" * 40)
-        print(evolution_section)
-        print("-" * 40)
+        print(f"[Dry Run] 将要{action}章节到: {skill_path.name}", file=out)
+        print("-" * 40, file=out)
+        print(evolution_section, file=out)
+        print("-" * 40, file=out)
         return True
 
     # 备份
@@ -215,27 +234,69 @@ def stitch_skill(skill_dir: str, dry_run: bool = False, backup: bool = False,
         timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
         backup_path = skill_md_path.with_suffix(f'.md.bak.{timestamp}')
         shutil.copy2(skill_md_path, backup_path)
-        print(f"已备份到: {backup_path}")
+        print(f"已备份到: {backup_path}", file=out)
 
     # 写入
     skill_md_path.write_text(new_content, encoding='utf-8')
-    print(f"✅ 已{action}经验章节: {skill_path.name}")
+    print(f"✅ 已{action}经验章节: {skill_path.name}", file=out)
 
     return True
 
 
+def run_worker(dry_run: bool = False, backup: bool = False,
+               layered: bool = False, project_path: str = None) -> None:
+    """
+    工作进程模式：从 stdin 逐行读取 Skill 目录并缝合
+
+    每处理一个 Skill 向 stdout 写一行 JSON：
+    {"skill_dir": ..., "success": bool, "out": str, "err": str}
+    供 align_all.py 复用同一进程批量处理，省去每个 Skill 的解释器启动开销。
+    """
+    import io
+
+    for raw in sys.stdin.buffer:
+        skill_dir = raw.decode('utf-8').strip()
+        if not skill_dir:
+            continue
+        out, err = io.StringIO(), io.StringIO()
+        try:
+            success = stitch_skill(skill_dir, dry_run=dry_run, backup=backup,
+                                   layered=layered, project_path=project_path,
+                                   out=out, err=err)
+        except Exception as e:
+            success = False
+            print(str(e), file=err)
+        result = {
+            "skill_dir": skill_dir,
+            "success": success,
+            "out": out.getvalue(),
+            "err": err.getvalue(),
+        }
+        sys.stdout.write(json.dumps(result) + "\n")
+        sys.stdout.flush()
+
+
 def main():
     import argparse
 
     parser = argparse.ArgumentParser(description='智能缝合经验到 SKILL.md')
-    parser.add_argument('skill_dir', help='Skill 目录路径')
+    parser.add_argument('skill_dir', nargs='?', help='Skill 目录路径（--worker 模式下省略）')
     parser.add_argument('--dry-run', action='store_true', help='仅预览，不修改文件')
     parser.add_argument('--backup', '-b', action='store_true', help='修改前备份原文件')
     parser.add_argument('--layered', '-l', action='store_true', help='启用分层合并模式')
     parser.add_argument('--project', '-p', help='项目路径（分层模式下使用）', default=None)
+    parser.add_argument('--worker', action='store_true',
+                        help='工作进程模式：从 stdin 逐行读取 Skill 目录')
 
     args = parser.parse_args()
 
+    if args.worker:
+        run_worker(dry_run=args.dry_run, backup=args.backup,
+                   layered=args.layered, project_path=args.project)
+        sys.exit(0)
+    if not args.skill_dir:
+        parser.error('缺少 skill_dir 参数')
+
     success = stitch_skill(
         args.skill_dir,
         dry_run=args.dry_run,
@@ -19,13 +19,19 @@ import datetime
 import re
 from typing import Optional
 
+# 名称清理与 README 徽章/图片清理的正则（模块加载时编译一次）
+_INVALID_NAME_CHARS_RE = re.compile(r'[^a-z0-9-]')
+_REPEATED_HYPHENS_RE = re.compile(r'-+')
+_BADGE_LINK_RE = re.compile(r'\[!\[.*?\]\(.*?\)\]\(.*?\)')
+_IMAGE_RE = re.compile(r'!\[.*?\]\(.*?\)')
+
 
 def sanitize_name(name: str) -> str:
     """将仓库名转换为合法的 Skill 名称"""
     # 转小写，替换非法字符为连字符
-    safe = re.sub(r'[^a-z0-9-]', '-', name.lower())
+    safe = _INVALID_NAME_CHARS_RE.sub('-', name.lower())
     # 合并连续连字符
-    safe = re.sub(r'-+', '-', safe)
+    safe = _REPEATED_HYPHENS_RE.sub('-', safe)
     # 去除首尾连字符
     safe = safe.strip('-')
     # 限制长度
@@ -64,8 +70,8 @@ def generate_skill_md(repo_info: dict, safe_name: str) -> str:
     readme_summary = readme[:800] + '...' if len(readme) > 800 else readme
 
     # 清理 README 中的徽章等
-    readme_summary = re.sub(r'\[!\[.*?\]\(.*?\)\]\(.*?\)', '', readme_summary)
-    readme_summary = re.sub(r'!\[.*?\]\(.*?\)', '', readme_summary)
+    readme_summary = _BADGE_LINK_RE.sub('', readme_summary)
+    readme_summary = _IMAGE_RE.sub('', readme_summary)
     readme_summary = readme_summary.strip()
 
     content = f"""---